@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated
 
@@ -16,8 +17,8 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from skill_installer import __version__
 from skill_installer.context import create_context
-from skill_installer.gitops import GitOpsError
-from skill_installer.tui import TUI, SkillInstallerApp
+from skill_installer.gitops import MAX_FETCH_WORKERS, GitOpsError
+from skill_installer.tui import TUI
 
 app = typer.Typer(
     name="skill-installer",
@@ -175,31 +176,45 @@ def _get_sources_to_update(ctx: AppContext, name: str | None) -> list[Source]:
     return filtered
 
 
-def _update_single_source(ctx: AppContext, source: Source) -> bool:
-    """Update a single source repository.
+def _fetch_source(ctx: AppContext, source: Source) -> GitOpsError | None:
+    """Clone or fetch one source, returning the error instead of raising it."""
+    try:
+        ctx.gitops.clone_or_fetch(source.url, source.name, source.ref)
+    except GitOpsError as e:
+        return e
+    return None
+
+
+def _update_sources(ctx: AppContext, sources: list[Source]) -> None:
+    """Update source repositories, fetching them concurrently.
+
+    Git fetches are network-bound and each source has its own clone
+    directory, so they run in a thread pool. Registry writes and output
+    stay on the calling thread, in source order.
 
     Args:
         ctx: Application context.
-        source: Source to update.
-
-    Returns:
-        True if successful, False otherwise.
+        sources: Sources to update.
     """
-    try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            progress.add_task(f"Updating {source.name}...", total=None)
-            ctx.gitops.clone_or_fetch(source.url, source.name, source.ref)
+    if not sources:
+        return
 
+    label = f"Updating {sources[0].name}..." if len(sources) == 1 else "Updating sources..."
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        progress.add_task(label, total=None)
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(sources))) as pool:
+            errors = list(pool.map(lambda source: _fetch_source(ctx, source), sources))
+
+    for source, error in zip(sources, errors, strict=True):
+        if error is not None:
+            tui.show_error(f"Failed to update '{source.name}': {error}")
+            continue
         ctx.registry.update_source_sync_time(source.name)
         tui.show_success(f"Updated '{source.name}'")
-        return True
-    except GitOpsError as e:
-        tui.show_error(f"Failed to update '{source.name}': {e}")
-        return False
 
 
 @source_app.command("update")
@@ -209,9 +224,7 @@ def source_update(
 ) -> None:
     """Update source repositories."""
     ctx = _context or create_context()
-    sources = _get_sources_to_update(ctx, name)
-    for source in sources:
-        _update_single_source(ctx, source)
+    _update_sources(ctx, _get_sources_to_update(ctx, name))
 
 
 # ============================================================================
@@ -448,8 +461,7 @@ def _sync_all_sources(ctx: AppContext) -> None:
     Args:
         ctx: Application context.
     """
-    for source in ctx.registry.list_sources():
-        _update_single_source(ctx, source)
+    _update_sources(ctx, ctx.registry.list_sources())
 
 
 def _sync_installed_item(ctx: AppContext, item: any) -> None:
@@ -544,6 +556,9 @@ def interactive(
     _context=None,
 ) -> None:
     """Run in interactive TUI mode."""
+    # Deferred so non-interactive commands never import Textual
+    from skill_installer.tui import SkillInstallerApp
+
     ctx = _context or create_context()
 
     tui_app = SkillInstallerApp(
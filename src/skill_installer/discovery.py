@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
-import json
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import yaml
+from skill_installer.validation import parse_frontmatter_fields
 
 if TYPE_CHECKING:
     from skill_installer.registry import MarketplaceManifest
 
+# Platforms that share another platform's item format
+_PLATFORM_ALIASES = {"vscode-insiders": "vscode"}
 
-@dataclass
+
+@dataclass(slots=True)
 class DiscoveredItem:
-    """A discovered item in a source repository."""
+    """A discovered item in a source repository.
+
+    Slotted: discovery creates one per file in every source on each reload.
+    """
 
     name: str
     item_type: str  # agent, skill, command, prompt
@@ -98,12 +104,10 @@ class Discovery:
         from skill_installer.registry import MarketplaceManifest
 
         marketplace_path = repo_path / self.MARKETPLACE_DIR / self.MARKETPLACE_FILE
-        if not marketplace_path.exists():
-            return None
-
+        # from_file checks existence itself; probing here too costs a stat
         try:
             return MarketplaceManifest.from_file(marketplace_path)
-        except (json.JSONDecodeError, ValueError):
+        except (FileNotFoundError, ValueError):
             return None
 
     def discover_from_marketplace(self, repo_path: Path) -> list[DiscoveredItem]:
@@ -173,14 +177,53 @@ class Discovery:
         if self.is_marketplace_repo(repo_path):
             items = self.discover_from_marketplace(repo_path)
         else:
+            # One walk of the tree serves all three item types
+            md_files = self._find_markdown_files(repo_path)
             items: list[DiscoveredItem] = []
-            items.extend(self._auto_discover_agents(repo_path))
-            items.extend(self._auto_discover_skills(repo_path))
-            items.extend(self._auto_discover_commands(repo_path))
+            items.extend(self._auto_discover_agents(repo_path, md_files))
+            items.extend(self._auto_discover_skills(repo_path, md_files))
+            items.extend(self._auto_discover_commands(repo_path, md_files))
 
         return self._filter_by_platform(items, platform) if platform else items
 
-    def _auto_discover_agents(self, repo_path: Path) -> list[DiscoveredItem]:
+    def _find_markdown_files(self, repo_path: Path) -> list[Path]:
+        """Find all *.md files under a repository in a single walk.
+
+        Directories in SKIP_DIRS are pruned rather than walked and filtered
+        afterwards, and os.scandir entries answer is_dir/is_file without an
+        extra stat per file. Like Path.glob("**"), directory symlinks are not
+        followed and files are listed before subdirectories (pre-order).
+
+        Args:
+            repo_path: Path to the repository root.
+
+        Returns:
+            Paths of markdown files, excluding those under skipped directories.
+        """
+        md_files: list[Path] = []
+        pending = [repo_path]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    subdirs: list[Path] = []
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in self.SKIP_DIRS:
+                                    subdirs.append(directory / entry.name)
+                            elif entry.name.endswith(".md") and entry.is_file():
+                                md_files.append(directory / entry.name)
+                        except OSError:
+                            continue  # Entry vanished or is unreadable
+            except OSError:
+                continue  # Directory vanished or is unreadable
+            pending.extend(reversed(subdirs))
+        return md_files
+
+    def _auto_discover_agents(
+        self, repo_path: Path, md_files: list[Path] | None = None
+    ) -> list[DiscoveredItem]:
         """Auto-discover agents and prompts by searching for agent/prompt files.
 
         Discovers:
@@ -190,16 +233,19 @@ class Discovery:
 
         Args:
             repo_path: Path to the repository root.
+            md_files: Markdown files already found under repo_path, if any.
 
         Returns:
             List of discovered agents and prompts.
         """
+        if md_files is None:
+            md_files = self._find_markdown_files(repo_path)
         items = []
         seen_paths: set[Path] = set()
 
         # 1. Find all .agent.md files (unambiguous agent marker)
-        for agent_file in repo_path.glob("**/*.agent.md"):
-            if any(skip_dir in agent_file.parts for skip_dir in self.SKIP_DIRS):
+        for agent_file in md_files:
+            if not agent_file.name.endswith(".agent.md"):
                 continue
             if agent_file not in seen_paths:
                 item = self._parse_agent_file(agent_file, "agent", repo_path=repo_path)
@@ -208,8 +254,8 @@ class Discovery:
                     seen_paths.add(agent_file)
 
         # 2. Find all .prompt.md files (VS Code prompts)
-        for prompt_file in repo_path.glob("**/*.prompt.md"):
-            if any(skip_dir in prompt_file.parts for skip_dir in self.SKIP_DIRS):
+        for prompt_file in md_files:
+            if not prompt_file.name.endswith(".prompt.md"):
                 continue
             if prompt_file not in seen_paths:
                 item = self._parse_agent_file(prompt_file, "prompt", repo_path=repo_path)
@@ -218,9 +264,7 @@ class Discovery:
                     seen_paths.add(prompt_file)
 
         # 3. Find .md files with valid agent frontmatter (must have 'name' field)
-        for md_file in repo_path.glob("**/*.md"):
-            if any(skip_dir in md_file.parts for skip_dir in self.SKIP_DIRS):
-                continue
+        for md_file in md_files:
             if md_file.name in self.SKIP_FILES:
                 continue
             if md_file.name.endswith(".agent.md") or md_file.name.endswith(".prompt.md"):
@@ -261,20 +305,24 @@ class Discovery:
 
         return items
 
-    def _auto_discover_skills(self, repo_path: Path) -> list[DiscoveredItem]:
+    def _auto_discover_skills(
+        self, repo_path: Path, md_files: list[Path] | None = None
+    ) -> list[DiscoveredItem]:
         """Auto-discover skills by searching for SKILL.md files recursively.
 
         Args:
             repo_path: Path to the repository root.
+            md_files: Markdown files already found under repo_path, if any.
 
         Returns:
             List of discovered skills.
         """
+        if md_files is None:
+            md_files = self._find_markdown_files(repo_path)
         items = []
 
-        for skill_file in repo_path.glob("**/SKILL.md"):
-            # Skip if in a directory we should ignore
-            if any(skip_dir in skill_file.parts for skip_dir in self.SKIP_DIRS):
+        for skill_file in md_files:
+            if skill_file.name != self.SKILL_PATTERN:
                 continue
 
             # The skill directory is the parent of SKILL.md
@@ -290,32 +338,34 @@ class Discovery:
 
         return items
 
-    def _auto_discover_commands(self, repo_path: Path) -> list[DiscoveredItem]:
+    def _auto_discover_commands(
+        self, repo_path: Path, md_files: list[Path] | None = None
+    ) -> list[DiscoveredItem]:
         """Auto-discover commands by searching for .claude/commands/ directories.
 
         Args:
             repo_path: Path to the repository root.
+            md_files: Markdown files already found under repo_path, if any.
 
         Returns:
             List of discovered commands.
         """
+        if md_files is None:
+            md_files = self._find_markdown_files(repo_path)
         items = []
 
-        # Search for commands directories (typically .claude/commands/)
-        for commands_dir in repo_path.glob("**/.claude/commands"):
-            if not commands_dir.is_dir():
+        # Commands are .md files with frontmatter directly inside a
+        # commands directory (typically .claude/commands/)
+        for path in md_files:
+            if path.parent.name != "commands" or path.name in self.SKIP_FILES:
                 continue
-            if any(skip_dir in commands_dir.parts for skip_dir in self.SKIP_DIRS):
+            if path.relative_to(repo_path).parts[-3:-1] != (".claude", "commands"):
                 continue
-
-            # Commands are .md files with frontmatter
-            for path in commands_dir.glob("*.md"):
-                if path.is_file() and path.name not in self.SKIP_FILES:
-                    item = self._parse_agent_file(
-                        path, "command", require_frontmatter=True, repo_path=repo_path
-                    )
-                    if item:
-                        items.append(item)
+            item = self._parse_agent_file(
+                path, "command", require_frontmatter=True, repo_path=repo_path
+            )
+            if item:
+                items.append(item)
 
         return items
 
@@ -340,7 +390,9 @@ class Discovery:
             DiscoveredItem or None if parsing fails or validation fails.
         """
         try:
-            content = path.read_text()
+            # Bytes skip the text layer; decoding the whole payload still
+            # rejects files that could not be installed as text later
+            content = path.read_bytes().decode("utf-8")
             frontmatter = self._parse_frontmatter(content)
 
             # Add plugin name to frontmatter if from marketplace
@@ -406,7 +458,7 @@ class Discovery:
         """
         skill_file = path / self.SKILL_PATTERN
         try:
-            content = skill_file.read_text()
+            content = skill_file.read_bytes().decode("utf-8")
             frontmatter = self._parse_frontmatter(content)
 
             # Add plugin name to frontmatter if from marketplace
@@ -445,15 +497,7 @@ class Discovery:
         Returns:
             Parsed frontmatter dict, empty if none found.
         """
-        if not content.startswith("---"):
-            return {}
-
-        try:
-            end_idx = content.index("---", 3)
-            frontmatter_str = content[3:end_idx].strip()
-            return yaml.safe_load(frontmatter_str) or {}
-        except (ValueError, yaml.YAMLError):
-            return {}
+        return parse_frontmatter_fields(content)
 
     def _filter_by_platform(
         self, items: list[DiscoveredItem], platform: str
@@ -467,13 +511,12 @@ class Discovery:
         Returns:
             Filtered list of items compatible with the specified platform.
         """
-        normalized = "vscode" if platform == "vscode-insiders" else platform
-        return [
-            item
-            for item in items
-            if item.platforms
-            and normalized in ["vscode" if p == "vscode-insiders" else p for p in item.platforms]
-        ]
+        # Every platform name that normalizes to the target, built once per call
+        normalized = _PLATFORM_ALIASES.get(platform, platform)
+        accepted = {normalized}.union(
+            alias for alias, target in _PLATFORM_ALIASES.items() if target == normalized
+        )
+        return [item for item in items if not accepted.isdisjoint(item.platforms)]
 
     def get_item_content(self, item: DiscoveredItem) -> str:
         """Get the content of a discovered item.
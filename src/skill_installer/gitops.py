@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
 import re
 import shutil
 import ssl
 import urllib.request
+from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -25,6 +27,87 @@ DEFAULT_BRANCHES = ["main", "master"]
 # Default cache location for cloned repos
 CACHE_DIR = Path.home() / ".skill-installer" / "cache"
 
+# HTTPS or SSH GitHub URLs, capturing (owner, repo)
+GITHUB_URL_PATTERNS = (
+    re.compile(r"github\.com[/:]([^/]+)/([^/.]+?)(?:\.git)?$"),
+    re.compile(r"github\.com[/:]([^/]+)/([^/.]+?)/?$"),
+)
+
+# Upper bound on concurrent git fetches when updating several sources
+MAX_FETCH_WORKERS = 8
+
+# License file names checked by get_license, in priority order
+LICENSE_FILENAMES = (
+    "LICENSE",
+    "LICENSE.md",
+    "LICENSE.txt",
+    "LICENCE",
+    "LICENCE.md",
+    "LICENCE.txt",
+    "COPYING",
+    "COPYING.md",
+    "COPYING.txt",
+)
+
+# (keyword, license id) pairs used when a license's first line is too long
+LONG_LICENSE_KEYWORDS = (
+    ("MIT", "MIT"),
+    ("APACHE", "Apache-2.0"),
+    ("GPL", "GPL"),
+    ("BSD", "BSD"),
+)
+
+# Read size when streaming file contents into a hash
+HASH_CHUNK_SIZE = 1 << 16
+
+
+def _list_files(root: Path) -> list[Path]:
+    """List regular files under root, sorted like sorted(root.rglob("*")).
+
+    os.scandir entries answer is_dir/is_file from the directory listing,
+    saving the stat per entry that Path.is_file would make. Directory
+    symlinks are not descended into, matching rglob.
+
+    Args:
+        root: Directory to walk.
+
+    Returns:
+        Sorted paths of files (including symlinks to files) under root.
+    """
+    files: list[Path] = []
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(directory / entry.name)
+                elif entry.is_file():
+                    files.append(directory / entry.name)
+    files.sort()
+    return files
+
+
+def _sha256_files(paths: Iterable[Path]) -> str:
+    """Hash the concatenated contents of files without loading them whole.
+
+    One buffer is reused via readinto for every file, so memory stays at
+    HASH_CHUNK_SIZE regardless of file size.
+
+    Args:
+        paths: Files to hash, in order.
+
+    Returns:
+        Hex digest of the SHA256 hash.
+    """
+    hasher = hashlib.sha256()
+    view = memoryview(bytearray(HASH_CHUNK_SIZE))
+    for path in paths:
+        with path.open("rb", buffering=0) as f:
+            while size := f.readinto(view):
+                hasher.update(view[:size])
+    return hasher.hexdigest()
+
 
 class GitOpsError(Exception):
     """Error during git operations."""
@@ -232,12 +315,8 @@ class GitOps:
         Returns:
             Tuple of (owner, repo) if GitHub URL, None otherwise.
         """
-        patterns = [
-            r"github\.com[/:]([^/]+)/([^/.]+?)(?:\.git)?$",
-            r"github\.com[/:]([^/]+)/([^/.]+?)/?$",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in GITHUB_URL_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1), match.group(2)
         return None
@@ -267,8 +346,7 @@ class GitOps:
         Returns:
             Hex digest of the SHA256 hash.
         """
-        content = path.read_bytes()
-        return hashlib.sha256(content).hexdigest()
+        return _sha256_files((path,))
 
     def get_tree_hash(self, path: Path) -> str:
         """Get combined hash of all files in a directory.
@@ -282,11 +360,7 @@ class GitOps:
         if path.is_file():
             return self.get_file_hash(path)
 
-        hasher = hashlib.sha256()
-        for file_path in sorted(path.rglob("*")):
-            if file_path.is_file():
-                hasher.update(file_path.read_bytes())
-        return hasher.hexdigest()
+        return _sha256_files(_list_files(path))
 
     def remove_cached(self, name: str) -> bool:
         """Remove a cached repository.
@@ -330,38 +404,31 @@ class GitOps:
         if not repo_path.exists():
             return None
 
-        license_patterns = [
-            "LICENSE",
-            "LICENSE.md",
-            "LICENSE.txt",
-            "LICENCE",
-            "LICENCE.md",
-            "LICENCE.txt",
-            "COPYING",
-            "COPYING.md",
-            "COPYING.txt",
-        ]
-
-        for pattern in license_patterns:
-            license_file = repo_path / pattern
-            if license_file.exists() and license_file.is_file():
-                try:
-                    content = license_file.read_text(encoding="utf-8", errors="ignore")
-                    lines = [line.strip() for line in content.split("\n") if line.strip()]
-                    if lines:
-                        first_line = lines[0]
-                        if len(first_line) > 100:
-                            if "MIT" in first_line.upper():
-                                return "MIT"
-                            if "APACHE" in first_line.upper():
-                                return "Apache-2.0"
-                            if "GPL" in first_line.upper():
-                                return "GPL"
-                            if "BSD" in first_line.upper():
-                                return "BSD"
-                            return first_line[:100] + "..."
-                        return first_line
-                except Exception:
-                    continue
+        # One listing instead of exists()/is_file() per pattern
+        try:
+            with os.scandir(repo_path) as entries:
+                root_files = {entry.name: entry.path for entry in entries if entry.is_file()}
+        except OSError:
+            return None
+
+        for pattern in LICENSE_FILENAMES:
+            found = root_files.get(pattern)
+            if found is None:
+                continue
+            try:
+                # Only the first non-empty line is used, so stop reading there
+                with open(found, encoding="utf-8", errors="ignore") as f:
+                    first_line = next((text for line in f if (text := line.strip())), None)
+            except Exception:
+                continue
+            if first_line is None:
+                continue
+            if len(first_line) > 100:
+                upper = first_line.upper()
+                for keyword, license_id in LONG_LICENSE_KEYWORDS:
+                    if keyword in upper:
+                        return license_id
+                return first_line[:100] + "..."
+            return first_line
 
         return None
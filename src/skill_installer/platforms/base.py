@@ -93,7 +93,7 @@ class BasePlatform(ABC):
         """
         result = parse_frontmatter(content)
         if not result.success:
-            return result.errors
+            return list(result.errors)
 
         errors = []
         for field in self.get_required_fields():
@@ -70,8 +70,9 @@ class MarketplaceManifest(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"Marketplace manifest not found: {path}")
 
-        data = json.loads(path.read_text())
-        return cls.model_validate(data)
+        # pydantic-core parses and validates in one pass, skipping the dict
+        # round trip through json.loads; ValidationError is a ValueError
+        return cls.model_validate_json(path.read_bytes())
 
 
 class Source(BaseModel):
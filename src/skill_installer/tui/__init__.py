@@ -4,29 +4,73 @@ This package provides both interactive (Textual-based) and non-interactive
 (Rich-based) terminal user interface components.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from skill_installer.tui._utils import sanitize_css_id as _sanitize_css_id
-from skill_installer.tui.app import SkillInstallerApp
 from skill_installer.tui.console import TUI, console
 from skill_installer.tui.models import DisplayItem, DisplaySource
-from skill_installer.tui.panes import DiscoverPane, InstalledPane, MarketplacesPane
-from skill_installer.tui.screens import (
-    AddSourceScreen,
-    ConfirmationScreen,
-    ItemDetailScreen,
-    LocationSelectionScreen,
-    SourceDetailScreen,
-)
-from skill_installer.tui.widgets import (
-    ItemDataTable,
-    ItemDetailOption,
-    ItemListView,
-    LocationOption,
-    ScrollIndicator,
-    SearchInput,
-    SourceDetailOption,
-    SourceListView,
-    SourceRow,
-)
+
+if TYPE_CHECKING:
+    from skill_installer.tui.app import SkillInstallerApp
+    from skill_installer.tui.panes import DiscoverPane, InstalledPane, MarketplacesPane
+    from skill_installer.tui.screens import (
+        AddSourceScreen,
+        ConfirmationScreen,
+        ItemDetailScreen,
+        LocationSelectionScreen,
+        SourceDetailScreen,
+    )
+    from skill_installer.tui.widgets import (
+        ItemDataTable,
+        ItemDetailOption,
+        ItemListView,
+        LocationOption,
+        ScrollIndicator,
+        SearchInput,
+        SourceDetailOption,
+        SourceListView,
+        SourceRow,
+    )
+
+# Textual-backed exports are imported on first access (PEP 562) so that
+# importing the package for the Rich console does not load Textual
+_LAZY_EXPORTS = {
+    "SkillInstallerApp": "skill_installer.tui.app",
+    "DiscoverPane": "skill_installer.tui.panes",
+    "InstalledPane": "skill_installer.tui.panes",
+    "MarketplacesPane": "skill_installer.tui.panes",
+    "AddSourceScreen": "skill_installer.tui.screens",
+    "ConfirmationScreen": "skill_installer.tui.screens",
+    "ItemDetailScreen": "skill_installer.tui.screens",
+    "LocationSelectionScreen": "skill_installer.tui.screens",
+    "SourceDetailScreen": "skill_installer.tui.screens",
+    "ItemDataTable": "skill_installer.tui.widgets",
+    "ItemDetailOption": "skill_installer.tui.widgets",
+    "ItemListView": "skill_installer.tui.widgets",
+    "LocationOption": "skill_installer.tui.widgets",
+    "ScrollIndicator": "skill_installer.tui.widgets",
+    "SearchInput": "skill_installer.tui.widgets",
+    "SourceDetailOption": "skill_installer.tui.widgets",
+    "SourceListView": "skill_installer.tui.widgets",
+    "SourceRow": "skill_installer.tui.widgets",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Private (for backward compatibility)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import locale
 import re
 import sys
@@ -29,9 +30,14 @@ def sanitize_css_id(value: str) -> str:
     return sanitized or "item"
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_terminal_text(text: str, max_length: int = 100) -> str:
     """Sanitize text for safe terminal rendering.
 
+    Results are memoized because every data reload rebuilds all DisplayItems,
+    re-sanitizing the same names, and source, platform and path strings repeat
+    across the items of a single build.
+
     Removes:
     - ANSI escape sequences (\\x1b[...)
     - Control characters (except \\n, \\t)
@@ -45,6 +51,12 @@ def sanitize_terminal_text(text: str, max_length: int = 100) -> str:
     Returns:
         Sanitized text safe for terminal display.
     """
+    # Fast path: printable ASCII has no escapes, controls or directional marks
+    if text.isascii() and text.isprintable():
+        if len(text) > max_length:
+            return text[: max_length - 3] + "..."
+        return text
+
     # Remove ANSI escape sequences (CSI, OSC, APC, DCS)
     # CSI: \x1b[...m (colors, cursor, etc.)
     # OSC: \x1b]...\x07 or \x1b]...\x1b\\ (titles, etc.)
@@ -66,9 +78,25 @@ def sanitize_terminal_text(text: str, max_length: int = 100) -> str:
     return text
 
 
+# Shared, read-only indicator sets returned by get_terminal_indicators
+_UTF8_INDICATORS: dict[str, str] = {
+    "checked": "\u25c9",  # ◉
+    "installed": "\u25cf",  # ●
+    "unchecked": "\u25cb",  # ○
+}
+_ASCII_INDICATORS: dict[str, str] = {
+    "checked": "[x]",
+    "installed": "[*]",
+    "unchecked": "[ ]",
+}
+
+
 def get_terminal_indicators() -> dict[str, str]:
     """Detect terminal UTF-8 support and return appropriate indicators.
 
+    Encoding is checked on every call (stdout may be swapped at runtime),
+    but the returned dict is shared and must not be mutated.
+
     Returns:
         Dict with keys: "checked", "installed", "unchecked"
     """
@@ -79,14 +107,4 @@ def get_terminal_indicators() -> dict[str, str]:
 
     supports_utf8 = encoding.lower() in ("utf-8", "utf8")
 
-    if supports_utf8:
-        return {
-            "checked": "\u25c9",  # ◉
-            "installed": "\u25cf",  # ●
-            "unchecked": "\u25cb",  # ○
-        }
-    return {
-        "checked": "[x]",
-        "installed": "[*]",
-        "unchecked": "[ ]",
-    }
+    return _UTF8_INDICATORS if supports_utf8 else _ASCII_INDICATORS
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
+from skill_installer.gitops import MAX_FETCH_WORKERS
 from skill_installer.tui.models import DisplayItem, DisplaySource
 
 if TYPE_CHECKING:
@@ -35,17 +37,33 @@ class DataManager:
         self.discovery = discovery
 
     def update_stale_sources(self) -> None:
-        """Update sources with auto_update enabled that are stale."""
+        """Update sources with auto_update enabled that are stale.
+
+        Fetches run concurrently, as in the CLI's source update; sync times
+        are recorded on the calling thread, in source order.
+        """
         if not self.registry_manager or not self.gitops:
             return
 
         stale_sources = self.registry_manager.get_stale_auto_update_sources()
-        for source in stale_sources:
+        if not stale_sources:
+            return
+
+        def fetch(source: Any) -> Exception | None:
             try:
                 self.gitops.clone_or_fetch(source.url, source.name)
-                self.registry_manager.update_source_sync_time(source.name)
             except Exception as e:
-                logger.debug("Failed to update source %s: %s", source.name, e)
+                return e
+            return None
+
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(stale_sources))) as pool:
+            errors = list(pool.map(fetch, stale_sources))
+
+        for source, error in zip(stale_sources, errors, strict=True):
+            if error is not None:
+                logger.debug("Failed to update source %s: %s", source.name, error)
+                continue
+            self.registry_manager.update_source_sync_time(source.name)
 
     def load_all_data(
         self,
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from skill_installer.tui._utils import sanitize_terminal_text
 
 if TYPE_CHECKING:
     from skill_installer.discovery import DiscoveredItem
@@ -13,6 +15,13 @@ if TYPE_CHECKING:
 class DisplayItem:
     """Generic item for display in the TUI."""
 
+    # Column width limits for terminal display
+    MAX_NAME_LENGTH: ClassVar[int] = 50
+    MAX_SOURCE_LENGTH: ClassVar[int] = 30
+    MAX_PLATFORM_LENGTH: ClassVar[int] = 20
+    MAX_DESCRIPTION_LENGTH: ClassVar[int] = 60
+    MAX_PATH_PREFIX_LENGTH: ClassVar[int] = 30
+
     name: str
     item_type: str
     description: str
@@ -23,6 +32,45 @@ class DisplayItem:
     source_url: str = ""
     relative_path: str = ""  # Path relative to repo root for disambiguation
 
+    # Sanitized column text, computed once at construction
+    display_name_source: str = field(init=False, repr=False, compare=False)
+    display_status: str = field(init=False, repr=False, compare=False)
+    display_description: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the sanitized list-column strings from external data (CRITICAL-001)."""
+        name = sanitize_terminal_text(self.name, max_length=self.MAX_NAME_LENGTH)
+        source = sanitize_terminal_text(self.source_name, max_length=self.MAX_SOURCE_LENGTH)
+        self.display_name_source = f"{name} \u2022 {source}"
+
+        self.display_status = ""
+        if self.installed_platforms:
+            max_platform = self.MAX_PLATFORM_LENGTH
+            platforms = [
+                sanitize_terminal_text(p, max_length=max_platform) for p in self.installed_platforms
+            ]
+            self.display_status = f"[{', '.join(platforms)}]"
+
+        # Description with path prefix for disambiguation
+        description = sanitize_terminal_text(
+            self.description or "No description",
+            max_length=self.MAX_DESCRIPTION_LENGTH,
+        )
+        path_prefix = ""
+        # relative_path is a normalized POSIX path, so slicing at the last "/"
+        # yields the parent without constructing path objects
+        parent = self.relative_path.rpartition("/")[0]
+        if parent:
+            path_prefix = (
+                f"[{sanitize_terminal_text(parent, max_length=self.MAX_PATH_PREFIX_LENGTH)}] "
+            )
+        max_description = self.MAX_DESCRIPTION_LENGTH
+        if len(path_prefix) + len(description) <= max_description:
+            self.display_description = path_prefix + description if path_prefix else description
+        else:
+            desc = path_prefix + description
+            self.display_description = desc[: max_description - 3] + "..."
+
     @property
     def unique_id(self) -> str:
         """Generate a unique ID for this item.
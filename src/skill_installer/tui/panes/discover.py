@@ -110,7 +110,7 @@ class DiscoverPane(Container):
             banner.update("")
             banner.remove_class("visible")
 
-    def _filter_items(self) -> None:
+    def _filter_items(self, debounce: bool = False) -> None:
         """Filter items based on search query, source filter, and platform filter."""
         filtered = self._all_items
 
@@ -145,7 +145,10 @@ class DiscoverPane(Container):
             ]
 
         list_view = self.query_one("#discover-list", ItemListView)
-        list_view.set_items(filtered)
+        if debounce:
+            list_view.set_items_debounced(filtered)
+        else:
+            list_view.set_items(filtered)
 
     def action_clear_filter(self) -> None:
         """Clear all filters."""
@@ -159,7 +162,7 @@ class DiscoverPane(Container):
     @on(Input.Changed, "#discover-search Input")
     def on_search_changed(self, event: Input.Changed) -> None:
         self._search_query = event.value
-        self._filter_items()
+        self._filter_items(debounce=True)
 
     @on(Select.Changed, "#platform-filter")
     def on_platform_filter_changed(self, event: Select.Changed) -> None:
@@ -37,7 +37,7 @@ class InstalledPane(Container):
         self._all_items = items
         self._filter_items()
 
-    def _filter_items(self) -> None:
+    def _filter_items(self, debounce: bool = False) -> None:
         """Filter items based on search query."""
         query = self._search_query.lower()
         if query:
@@ -52,9 +52,12 @@ class InstalledPane(Container):
             filtered = self._all_items
 
         list_view = self.query_one("#installed-list", ItemListView)
-        list_view.set_items(filtered)
+        if debounce:
+            list_view.set_items_debounced(filtered)
+        else:
+            list_view.set_items(filtered)
 
     @on(Input.Changed, "#installed-search Input")
     def on_search_changed(self, event: Input.Changed) -> None:
         self._search_query = event.value
-        self._filter_items()
+        self._filter_items(debounce=True)
@@ -0,0 +1,68 @@
+"""Shared base for option-list modal screens."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.reactive import reactive
+from textual.screen import ModalScreen, ScreenResultType
+from textual.widget import Widget
+
+
+class _OptionListModal(ModalScreen[ScreenResultType]):
+    """Modal screen with a vertically navigable list of option widgets.
+
+    Subclasses mount their options via `_mount_options` and implement
+    `compose`, `on_mount` and their own select/confirm action. Option
+    widgets must expose a reactive `selected` attribute.
+    """
+
+    BINDINGS = [
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("k", "cursor_up", "Up", show=False),
+        Binding("j", "cursor_down", "Down", show=False),
+    ]
+
+    selected_index = reactive(0)
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._option_widgets: list[Any] = []
+
+    def _mount_options(self, container_id: str, widgets: Iterable[Widget]) -> None:
+        """Mount option widgets into a container, selecting the first.
+
+        Args:
+            container_id: CSS selector of the container to mount into.
+            widgets: Option widgets to mount, in display order.
+        """
+        container = self.query_one(container_id, Vertical)
+        for i, widget in enumerate(widgets):
+            widget.selected = i == 0  # type: ignore[attr-defined]
+            self._option_widgets.append(widget)
+            container.mount(widget)
+
+    def watch_selected_index(self, old_index: int, new_index: int) -> None:
+        # Batch both option class changes into a single repaint
+        with self.app.batch_update():
+            if 0 <= old_index < len(self._option_widgets):
+                self._option_widgets[old_index].selected = False
+            if 0 <= new_index < len(self._option_widgets):
+                self._option_widgets[new_index].selected = True
+                self._option_widgets[new_index].scroll_visible()
+
+    def action_cursor_up(self) -> None:
+        if self.selected_index > 0:
+            self.selected_index -= 1
+
+    def action_cursor_down(self) -> None:
+        if self.selected_index < len(self._option_widgets) - 1:
+            self.selected_index += 1
+
+    def action_cancel(self) -> None:
+        """Close the screen without a result."""
+        self.dismiss(None)
@@ -7,15 +7,14 @@ from typing import Any
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
-from textual.reactive import reactive
-from textual.screen import ModalScreen
 from textual.widgets import Static
 
 from skill_installer.tui.models import DisplayItem
+from skill_installer.tui.screens._modal_base import _OptionListModal
 from skill_installer.tui.widgets.options import ItemDetailOption
 
 
-class ItemDetailScreen(ModalScreen[tuple[str, DisplayItem] | None]):
+class ItemDetailScreen(_OptionListModal[tuple[str, DisplayItem] | None]):
     """Modal screen for viewing item details."""
 
     DEFAULT_CSS = """
@@ -74,16 +73,10 @@ class ItemDetailScreen(ModalScreen[tuple[str, DisplayItem] | None]):
     """
 
     BINDINGS = [
-        Binding("up", "cursor_up", "Up", show=False),
-        Binding("down", "cursor_down", "Down", show=False),
-        Binding("k", "cursor_up", "Up", show=False),
-        Binding("j", "cursor_down", "Down", show=False),
         Binding("enter", "select_option", "Select"),
         Binding("escape", "cancel", "Close"),
     ]
 
-    selected_index = reactive(0)
-
     def __init__(
         self,
         item: DisplayItem,
@@ -94,7 +87,6 @@ class ItemDetailScreen(ModalScreen[tuple[str, DisplayItem] | None]):
         self.item = item
         self.registry_manager = registry_manager
         self._options: list[tuple[str, str]] = []
-        self._option_widgets: list[ItemDetailOption] = []
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -189,27 +181,13 @@ class ItemDetailScreen(ModalScreen[tuple[str, DisplayItem] | None]):
         self._options.append(("back", "Back to list"))
 
         # Add option widgets
-        options_container = self.query_one("#item-detail-options", Vertical)
-        for i, (option_id, label) in enumerate(self._options):
-            option = ItemDetailOption(label, id=f"item-option-{option_id}")
-            option.selected = i == 0
-            self._option_widgets.append(option)
-            options_container.mount(option)
-
-    def watch_selected_index(self, old_index: int, new_index: int) -> None:
-        if 0 <= old_index < len(self._option_widgets):
-            self._option_widgets[old_index].selected = False
-        if 0 <= new_index < len(self._option_widgets):
-            self._option_widgets[new_index].selected = True
-            self._option_widgets[new_index].scroll_visible()
-
-    def action_cursor_up(self) -> None:
-        if self.selected_index > 0:
-            self.selected_index -= 1
-
-    def action_cursor_down(self) -> None:
-        if self.selected_index < len(self._options) - 1:
-            self.selected_index += 1
+        self._mount_options(
+            "#item-detail-options",
+            (
+                ItemDetailOption(label, id=f"item-option-{option_id}")
+                for option_id, label in self._options
+            ),
+        )
 
     def action_select_option(self) -> None:
         """Select the current option."""
@@ -219,7 +197,3 @@ class ItemDetailScreen(ModalScreen[tuple[str, DisplayItem] | None]):
                 self.dismiss(None)
             else:
                 self.dismiss((option_id, self.item))
-
-    def action_cancel(self) -> None:
-        """Close the screen."""
-        self.dismiss(None)
@@ -7,15 +7,14 @@ from typing import Any
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
-from textual.reactive import reactive
-from textual.screen import ModalScreen
 from textual.widgets import Static
 
 from skill_installer.tui.models import DisplaySource
+from skill_installer.tui.screens._modal_base import _OptionListModal
 from skill_installer.tui.widgets.options import SourceDetailOption
 
 
-class SourceDetailScreen(ModalScreen[tuple[str, DisplaySource] | None]):
+class SourceDetailScreen(_OptionListModal[tuple[str, DisplaySource] | None]):
     """Modal screen for viewing source details."""
 
     DEFAULT_CSS = """
@@ -60,21 +59,14 @@ class SourceDetailScreen(ModalScreen[tuple[str, DisplaySource] | None]):
     """
 
     BINDINGS = [
-        Binding("up", "cursor_up", "Up", show=False),
-        Binding("down", "cursor_down", "Down", show=False),
-        Binding("k", "cursor_up", "Up", show=False),
-        Binding("j", "cursor_down", "Down", show=False),
         Binding("enter", "select_option", "Select"),
         Binding("escape", "cancel", "Close"),
     ]
 
-    selected_index = reactive(0)
-
     def __init__(self, source: DisplaySource, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.source = source
         self._options: list[tuple[str, str, str]] = []
-        self._option_widgets: list[SourceDetailOption] = []
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -110,27 +102,13 @@ class SourceDetailScreen(ModalScreen[tuple[str, DisplaySource] | None]):
         ]
 
         # Add option widgets
-        options_container = self.query_one("#detail-options", Vertical)
-        for i, (option_id, label, meta) in enumerate(self._options):
-            option = SourceDetailOption(label, meta, id=f"option-{option_id}")
-            option.selected = i == 0
-            self._option_widgets.append(option)
-            options_container.mount(option)
-
-    def watch_selected_index(self, old_index: int, new_index: int) -> None:
-        if 0 <= old_index < len(self._option_widgets):
-            self._option_widgets[old_index].selected = False
-        if 0 <= new_index < len(self._option_widgets):
-            self._option_widgets[new_index].selected = True
-            self._option_widgets[new_index].scroll_visible()
-
-    def action_cursor_up(self) -> None:
-        if self.selected_index > 0:
-            self.selected_index -= 1
-
-    def action_cursor_down(self) -> None:
-        if self.selected_index < len(self._options) - 1:
-            self.selected_index += 1
+        self._mount_options(
+            "#detail-options",
+            (
+                SourceDetailOption(label, meta, id=f"option-{option_id}")
+                for option_id, label, meta in self._options
+            ),
+        )
 
     def action_select_option(self) -> None:
         """Select the current option."""
@@ -140,7 +118,3 @@ class SourceDetailScreen(ModalScreen[tuple[str, DisplaySource] | None]):
                 self.dismiss(None)
             else:
                 self.dismiss((option_id, self.source))
-
-    def action_cancel(self) -> None:
-        """Close the screen."""
-        self.dismiss(None)
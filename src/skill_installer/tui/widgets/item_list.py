@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from pathlib import PurePosixPath
+from itertools import compress
 from typing import Any
 
 from textual import on
 from textual.binding import Binding
 from textual.coordinate import Coordinate
 from textual.message import Message
+from textual.timer import Timer
 from textual.widgets import DataTable
 
-from skill_installer.tui._utils import get_terminal_indicators, sanitize_terminal_text
+from skill_installer.tui._utils import get_terminal_indicators
 from skill_installer.tui.models import DisplayItem
 
 
@@ -23,13 +24,6 @@ class ItemDataTable(DataTable):
     virtualization (rendering only visible rows instead of all items).
     """
 
-    # Column width limits for terminal display
-    MAX_NAME_LENGTH = 50
-    MAX_SOURCE_LENGTH = 30
-    MAX_PLATFORM_LENGTH = 20
-    MAX_DESCRIPTION_LENGTH = 60
-    MAX_PATH_PREFIX_LENGTH = 30
-
     DEFAULT_CSS = """
     ItemDataTable {
         height: 1fr;
@@ -64,6 +58,15 @@ class ItemDataTable(DataTable):
         Binding("space", "toggle", "Toggle"),
     ]
 
+    # Quiet period used to coalesce bursts of set_items_debounced calls
+    DEBOUNCE_SECONDS = 0.04
+
+    # remove_row is O(rows), so larger removals fall back to a full rebuild
+    MAX_DIFF_REMOVALS = 50
+
+    # Column key for the checkbox/installed indicator column
+    INDICATOR_COLUMN = "indicator"
+
     can_focus = True
 
     class ItemSelected(Message):
@@ -84,15 +87,52 @@ class ItemDataTable(DataTable):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.items: list[DisplayItem] = []
+        self._items_by_id: dict[str, DisplayItem] = {}
+        self._index_by_id: dict[str, int] = {}
+        self._row_ids: list[str] = []
         self._checked: set[str] = set()
+        # Checked flags aligned with self.items; _checked stays canonical across set_items
+        self._checked_bits = bytearray()
         self._is_filtering = False  # Mutex flag for race condition protection
+        self._pending_items: list[DisplayItem] | None = None
+        self._debounce_timer: Timer | None = None
         self.cursor_type = "row"
         self.zebra_stripes = True
         self._indicators = get_terminal_indicators()
+        # Plain attributes avoid a dict lookup per row in _get_indicator
+        self._ind_checked = self._indicators["checked"]
+        self._ind_installed = self._indicators["installed"]
+        self._ind_unchecked = self._indicators["unchecked"]
 
     def on_mount(self) -> None:
         """Initialize table columns on mount."""
-        self.add_columns("", "Name \u2022 Source", "Status", "Description")
+        self.add_column("", key=self.INDICATOR_COLUMN)
+        self.add_columns("Name \u2022 Source", "Status", "Description")
+
+    def set_items_debounced(self, items: list[DisplayItem]) -> None:
+        """Replace all items after a short quiet period.
+
+        Intended for search keystrokes: only the most recent list within
+        DEBOUNCE_SECONDS is applied, so intermediate filter states never
+        rebuild the table.
+        """
+        self._pending_items = items
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+        self._debounce_timer = self.set_timer(self.DEBOUNCE_SECONDS, self._flush_pending_items)
+
+    def _flush_pending_items(self) -> None:
+        """Apply the most recent debounced item list."""
+        items = self._pending_items
+        if items is not None:
+            self.set_items(items)
+
+    def _cancel_pending_items(self) -> None:
+        """Drop any debounced update so it cannot overwrite a newer list."""
+        self._pending_items = None
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+            self._debounce_timer = None
 
     def set_items(self, items: list[DisplayItem]) -> None:
         """Replace all items (same API as old ItemListView).
@@ -100,81 +140,157 @@ class ItemDataTable(DataTable):
         Preserves checked state across item updates.
         Sets _is_filtering to prevent toggle race conditions.
         """
+        self._cancel_pending_items()
         self._is_filtering = True
         try:
             # Preserve checked state before clearing
             checked_ids = self._checked.copy()
 
-            self.clear()
-            self.items = items
-
-            # Bulk add rows for performance
-            for item in items:
-                indicator = self._get_indicator(item, checked_ids)
-
-                # Sanitize external data (CRITICAL-001)
-                name = sanitize_terminal_text(item.name, max_length=self.MAX_NAME_LENGTH)
-                source = sanitize_terminal_text(item.source_name, max_length=self.MAX_SOURCE_LENGTH)
-                name_source = f"{name} \u2022 {source}"
-
-                # Sanitize platform names from external data
-                status = (
-                    f"[{', '.join(sanitize_terminal_text(p, max_length=self.MAX_PLATFORM_LENGTH) for p in item.installed_platforms)}]"
-                    if item.installed_platforms
-                    else ""
+            items_by_id: dict[str, DisplayItem] = {}
+            index_by_id: dict[str, int] = {}
+            row_ids: list[str] = []
+
+            get_indicator = self._get_indicator
+
+            # Build all row tuples first, then insert them in a single batch.
+            # Column text is precomputed on DisplayItem, so this is lookups only.
+            rows: list[tuple[str, str, str, str, str]] = []
+            for idx, item in enumerate(items):
+                unique_id = item.unique_id
+                items_by_id[unique_id] = item
+                index_by_id[unique_id] = idx
+                row_ids.append(unique_id)
+                rows.append(
+                    (
+                        get_indicator(item, checked_ids),
+                        item.display_name_source,
+                        item.display_status,
+                        item.display_description,
+                        unique_id,
+                    )
                 )
 
-                # Build description with path prefix (sanitize path from external data)
-                description = sanitize_terminal_text(
-                    item.description or "No description",
-                    max_length=self.MAX_DESCRIPTION_LENGTH,
-                )
-                path_prefix = ""
-                if item.relative_path:
-                    parent = str(PurePosixPath(item.relative_path).parent)
-                    if parent and parent != ".":
-                        path_prefix = f"[{sanitize_terminal_text(parent, max_length=self.MAX_PATH_PREFIX_LENGTH)}] "
-                desc = path_prefix + description
-                if len(desc) > self.MAX_DESCRIPTION_LENGTH:
-                    desc = desc[: self.MAX_DESCRIPTION_LENGTH - 3] + "..."
-
-                self.add_row(indicator, name_source, status, desc, key=item.unique_id)
-
-            # Restore checked state
+            # DataTable.add_rows cannot assign row keys, so add keyed rows inside
+            # one batch_update to defer refresh until every row is in place
+            with self.app.batch_update():
+                if not self._apply_row_diff(items_by_id, rows):
+                    self.clear()
+                    add_row = self.add_row
+                    for indicator, name_source, status, desc, key in rows:
+                        add_row(indicator, name_source, status, desc, key=key)
+
+            self.items = items
+            # Restore checked state (indicators above already reflect it)
             self._checked = checked_ids
-            self._sync_checked_state_with_display()
+            self._items_by_id = items_by_id
+            self._index_by_id = index_by_id
+            self._row_ids = row_ids
+            checked_bits = bytearray(len(items))
+            for unique_id in checked_ids:
+                idx = index_by_id.get(unique_id)
+                if idx is not None:
+                    checked_bits[idx] = 1
+            self._checked_bits = checked_bits
         finally:
             self._is_filtering = False
 
+    def _apply_row_diff(
+        self,
+        items_by_id: dict[str, DisplayItem],
+        rows: list[tuple[str, str, str, str, str]],
+    ) -> bool:
+        """Update the table in place by removing and appending keyed rows.
+
+        Handles the common filter case where the new list keeps the current
+        rows (same objects, same relative order) and only adds rows at the end.
+
+        Args:
+            items_by_id: New items keyed by unique ID, in display order.
+            rows: Row cells plus key for each new item, in display order.
+
+        Returns:
+            True if the diff was applied, False if a full rebuild is needed.
+        """
+        old_index = self._index_by_id
+        if not old_index or len(items_by_id) != len(rows) or self.row_count != len(old_index):
+            return False
+
+        first_added = self._find_first_appended(items_by_id)
+        if first_added is None:
+            return False
+
+        removed = [unique_id for unique_id in old_index if unique_id not in items_by_id]
+        if len(removed) > self.MAX_DIFF_REMOVALS:
+            return False
+
+        for unique_id in removed:
+            self.remove_row(unique_id)
+        add_row = self.add_row
+        for indicator, name_source, status, desc, key in rows[first_added:]:
+            add_row(indicator, name_source, status, desc, key=key)
+
+        # Match clear(): a new list starts at the top
+        self.cursor_coordinate = Coordinate(0, 0)
+        self.scroll_home(animate=False)
+        return True
+
+    def _find_first_appended(self, items_by_id: dict[str, DisplayItem]) -> int | None:
+        """Find where appended rows start if the new list only keeps and appends.
+
+        Args:
+            items_by_id: New items keyed by unique ID, in display order.
+
+        Returns:
+            Position of the first new item (len(items_by_id) if none), or None
+            if a kept item changed or moved, or a new item precedes a kept one.
+        """
+        old_index = self._index_by_id
+        old_items = self._items_by_id
+        first_added = len(items_by_id)
+        last_kept = -1
+        for position, (unique_id, item) in enumerate(items_by_id.items()):
+            old_position = old_index.get(unique_id)
+            if old_position is None:
+                first_added = min(first_added, position)
+                continue
+            if (
+                position > first_added
+                or old_position < last_kept
+                or old_items[unique_id] is not item
+            ):
+                return None
+            last_kept = old_position
+        return first_added
+
     def _get_indicator(self, item: DisplayItem, checked_set: set[str] | None = None) -> str:
         """Get the indicator for an item."""
         check_set = checked_set if checked_set is not None else self._checked
         if item.unique_id in check_set:
-            return self._indicators["checked"]
+            return self._ind_checked
         if item.installed_platforms:
-            return self._indicators["installed"]
-        return self._indicators["unchecked"]
-
-    def _sync_checked_state_with_display(self) -> None:
-        """Synchronize checked indicators with _checked set."""
-        for idx, item in enumerate(self.items):
-            if item.unique_id in self._checked:
-                coord = Coordinate(idx, 0)
-                if coord.row < self.row_count:
-                    self.update_cell_at(coord, self._indicators["checked"])
+            return self._ind_installed
+        return self._ind_unchecked
 
     def get_checked_items(self) -> list[DisplayItem]:
-        """Get all currently checked items."""
-        return [item for item in self.items if item.unique_id in self._checked]
+        """Get all currently checked items in display order."""
+        return list(compress(self.items, self._checked_bits))
 
     def clear_checked(self) -> None:
         """Clear all checked items."""
         self._checked.clear()
-        for idx, item in enumerate(self.items):
-            coord = Coordinate(idx, 0)
-            if coord.row < self.row_count:
-                indicator = self._get_indicator(item)
-                self.update_cell_at(coord, indicator)
+        # Only rows that were checked need their indicator reset; address cells
+        # by row/column key so no Coordinate is built per row
+        bits = self._checked_bits
+        items = self.items
+        row_ids = self._row_ids
+        column = self.INDICATOR_COLUMN
+        with self.app.batch_update():
+            for idx in compress(range(len(bits)), bits):
+                indicator = (
+                    self._ind_installed if items[idx].installed_platforms else self._ind_unchecked
+                )
+                self.update_cell(row_ids[idx], column, indicator)
+        self._checked_bits = bytearray(len(items))
 
     def action_toggle(self) -> None:
         """Toggle the checked state of the current row."""
@@ -199,11 +315,10 @@ class ItemDataTable(DataTable):
         else:
             self._checked.add(unique_id)
             new_checked = True
+        self._checked_bits[row_idx] = new_checked
 
         # Update indicator
-        coord = Coordinate(row_idx, 0)
-        indicator = self._get_indicator(item)
-        self.update_cell_at(coord, indicator)
+        self.update_cell(unique_id, self.INDICATOR_COLUMN, self._get_indicator(item))
 
         # Post message
         self.post_message(self.ItemToggled(item, new_checked))
@@ -216,10 +331,7 @@ class ItemDataTable(DataTable):
             return
 
         # Find item by row key (use row_key, not cursor_row per plan correction)
-        item = next(
-            (item for item in self.items if item.unique_id == str(row_key.value)),
-            None,
-        )
+        item = self._items_by_id.get(str(row_key.value))
         if item:
             self.post_message(self.ItemSelected(item))
 
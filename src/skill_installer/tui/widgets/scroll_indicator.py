@@ -23,6 +23,8 @@ class ScrollIndicator(Static):
         self._total = 0
         self._visible = 0
         self._position = 0
+        # (more above, more below) last rendered; None means nothing shown
+        self._last_state: tuple[bool, bool] | None = None
 
     def update_position(self, position: int, visible: int, total: int) -> None:
         self._position = position
@@ -31,14 +33,25 @@ class ScrollIndicator(Static):
         self._update_text()
 
     def _update_text(self) -> None:
-        if self._total <= self._visible:
+        state = (
+            (self._position > 0, self._position + self._visible < self._total)
+            if self._total > self._visible
+            else None
+        )
+        # Most cursor moves do not change the text; skip the re-render
+        if state == self._last_state:
+            return
+        self._last_state = state
+
+        if state is None:
             self.update("")
             return
 
+        more_above, more_below = state
         text_parts = []
-        if self._position > 0:
+        if more_above:
             text_parts.append("\u2191 more above")
-        if self._position + self._visible < self._total:
+        if more_below:
             text_parts.append("\u2193 more below")
 
         self.update(" | ".join(text_parts))
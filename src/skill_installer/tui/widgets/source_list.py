@@ -44,19 +44,41 @@ class SourceRow(Widget):
     def __init__(self, source: DisplaySource, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.source = source
+        self._name_label: Static | None = None
+        self._url_label: Static | None = None
+        self._stats_label: Static | None = None
+
+    @staticmethod
+    def _stats_line(source: DisplaySource) -> str:
+        """Build stats line: "X available * Y installed * Updated date"."""
+        stats_parts = [f"{source.available_count} available"]
+        if source.installed_count > 0:
+            stats_parts.append(f"{source.installed_count} installed")
+        stats_parts.append(f"Updated {source.last_sync}")
+        return " * ".join(stats_parts)
 
     def compose(self) -> ComposeResult:
-        # Build stats line: "X available * Y installed * Updated date"
-        stats_parts = [f"{self.source.available_count} available"]
-        if self.source.installed_count > 0:
-            stats_parts.append(f"{self.source.installed_count} installed")
-        stats_parts.append(f"Updated {self.source.last_sync}")
-        stats_line = " * ".join(stats_parts)
-
+        self._name_label = Static(self.source.display_name, classes="source-name")
+        self._url_label = Static(self.source.url, classes="source-url")
+        self._stats_label = Static(self._stats_line(self.source), classes="source-stats")
         with Vertical():
-            yield Static(self.source.display_name, classes="source-name")
-            yield Static(self.source.url, classes="source-url")
-            yield Static(stats_line, classes="source-stats")
+            yield self._name_label
+            yield self._url_label
+            yield self._stats_label
+
+    def update_source(self, source: DisplaySource) -> None:
+        """Refresh the row in place, updating only the lines that changed."""
+        old = self.source
+        self.source = source
+        if self._name_label is None or self._url_label is None or self._stats_label is None:
+            return  # Not composed yet; compose will read self.source
+        if source.display_name != old.display_name:
+            self._name_label.update(source.display_name)
+        if source.url != old.url:
+            self._url_label.update(source.url)
+        stats_line = self._stats_line(source)
+        if stats_line != self._stats_line(old):
+            self._stats_label.update(stats_line)
 
     def watch_selected(self, selected: bool) -> None:
         self.set_class(selected, "selected")
@@ -114,6 +136,7 @@ class SourceListView(VerticalScroll):
         super().__init__(**kwargs)
         self.sources: list[DisplaySource] = []
         self._rows: list[SourceRow] = []
+        self._rows_by_name: dict[str, SourceRow] = {}
         self._update_counter = 0  # Instance counter to ensure unique IDs on refresh
 
     @property
@@ -128,33 +151,88 @@ class SourceListView(VerticalScroll):
         return f"{self.id}--{self._update_counter}--{index}--{sanitized}"
 
     def set_sources(self, sources: list[DisplaySource]) -> None:
-        """Update the sources list."""
+        """Update the sources list.
+
+        Rows are keyed by source name: existing rows are updated in place,
+        rows for removed sources are dropped, and only new sources mount rows.
+        """
         # Increment update counter to ensure new unique IDs
         self._update_counter += 1
 
-        # Remove all existing children first
-        children = list(self.children)
-        for child in children:
-            child.remove()
+        if self._can_diff(sources):
+            self._apply_diff(sources)
+        else:
+            self._rebuild(sources)
+
+    def _can_diff(self, sources: list[DisplaySource]) -> bool:
+        """Check whether some rows can be reused without reordering them."""
+        names = [source.name for source in sources]
+        new_names = set(names)
+        if len(new_names) != len(names):
+            return False
+        kept = [name for name in names if name in self._rows_by_name]
+        if not kept:
+            # Nothing to reuse: the bulk remove/mount in _rebuild is cheaper
+            return False
+        current = [row.source.name for row in self._rows if row.source.name in new_names]
+        return kept == current
+
+    def _apply_diff(self, sources: list[DisplaySource]) -> None:
+        """Update kept rows in place, drop removed ones and mount new ones."""
+        new_names = {source.name for source in sources}
+        for name in [name for name in self._rows_by_name if name not in new_names]:
+            self._rows_by_name.pop(name).remove()
+
+        # New rows ahead of every reused row are inserted before the first one
+        first_kept = next(
+            self._rows_by_name[s.name] for s in sources if s.name in self._rows_by_name
+        )
+        rows: list[SourceRow] = []
+        for i, source in enumerate(sources):
+            row = self._rows_by_name.get(source.name)
+            if row is None:
+                row = SourceRow(source, id=self._make_row_id(i, source))
+                if rows:
+                    self.mount(row, after=rows[-1])
+                else:
+                    self.mount(row, before=first_kept)
+                self._rows_by_name[source.name] = row
+            else:
+                row.update_source(source)
+            row.selected = i == 0
+            rows.append(row)
+
+        # Reset state; rows must be swapped in before the selection watcher runs
+        self.sources = sources
+        self._rows = rows
+        self.selected_index = 0
+
+    def _rebuild(self, sources: list[DisplaySource]) -> None:
+        """Replace every row."""
+        # Remove all existing children in a single bulk operation
+        self.remove_children()
 
         # Reset state
         self.sources = sources
-        self.selected_index = 0
         self._rows = []
+        self.selected_index = 0
 
         # Mount new rows with new unique IDs
         for i, source in enumerate(sources):
             row = SourceRow(source, id=self._make_row_id(i, source))
             row.selected = i == 0
             self._rows.append(row)
-            self.mount(row)
+        self._rows_by_name = {row.source.name: row for row in self._rows}
+        self.mount_all(self._rows)
 
     def watch_selected_index(self, old_index: int, new_index: int) -> None:
-        if 0 <= old_index < len(self._rows):
-            self._rows[old_index].selected = False
-        if 0 <= new_index < len(self._rows):
-            self._rows[new_index].selected = True
-            self._rows[new_index].scroll_visible()
+        # Batch both row class changes into a single repaint
+        with self.app.batch_update():
+            if 0 <= old_index < len(self._rows):
+                self._rows[old_index].selected = False
+            if 0 <= new_index < len(self._rows):
+                self._rows[new_index].selected = True
+                self._rows[new_index].scroll_visible()
 
     def action_cursor_up(self) -> None:
         if self.selected_index > 0:
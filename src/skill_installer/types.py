@@ -8,10 +8,12 @@ from pathlib import Path
 __all__ = ["InstallResult"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InstallResult:
     """Result of an installation operation.
 
+    Immutable and slotted: batch installs create one per item and platform.
+
     Attributes:
         success: True if installation succeeded.
         item_id: Item identifier in format source/type/key.
@@ -28,9 +30,10 @@ class InstallResult:
 
     def __post_init__(self) -> None:
         """Validate invariants."""
-        if self.success and self.error is not None:
-            raise ValueError("success=True but error is set")
-        if not self.success and self.error is None:
-            raise ValueError("success=False requires error message")
         if not self.item_id:
             raise ValueError("item_id cannot be empty")
+        if self.success:
+            if self.error is not None:
+                raise ValueError("success=True but error is set")
+        elif self.error is None:
+            raise ValueError("success=False requires error message")
@@ -6,6 +6,23 @@ across platform implementations.
 
 from __future__ import annotations
 
+import copy
+import functools
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Shared by every successful parse so the common path allocates no list
+_EMPTY_ERRORS: tuple[str, ...] = ()
+
+_ERR_NO_FRONTMATTER = "Content must have YAML frontmatter"
+_ERR_NO_CLOSING = "Invalid frontmatter: missing closing ---"
+
 
 class FrontmatterResult:
     """Result of parsing frontmatter from content."""
@@ -17,20 +34,24 @@ class FrontmatterResult:
 
         Args:
             data: The parsed frontmatter content (raw YAML string).
-            errors: List of parsing errors encountered.
+            errors: List of parsing errors encountered. When empty, the
+                shared read-only empty tuple is stored instead.
         """
         self.data = data
-        self.errors = errors or []
-        self.success = len(self.errors) == 0
+        self.errors: list[str] | tuple[str, ...] = errors if errors else _EMPTY_ERRORS
+        self.success = not errors
 
 
-def parse_frontmatter(content: str) -> FrontmatterResult:
+def parse_frontmatter(content: str | bytes) -> FrontmatterResult:
     """Parse YAML frontmatter from markdown content.
 
     Extracts the frontmatter block between the opening and closing '---'
     delimiters. Returns a result object containing the parsed data or
     any errors encountered.
 
+    Raw UTF-8 bytes (e.g. straight from a file read) are scanned as bytes
+    and only the frontmatter slice is decoded; the body is never decoded.
+
     Args:
         content: The full markdown content with optional frontmatter.
 
@@ -44,12 +65,57 @@ def parse_frontmatter(content: str) -> FrontmatterResult:
         >>> result.data
         'name: test'
     """
-    if not content.startswith("---"):
-        return FrontmatterResult(errors=["Content must have YAML frontmatter"])
+    delimiter = b"---" if isinstance(content, bytes) else "---"
+    if not content.startswith(delimiter):  # type: ignore[arg-type]
+        return FrontmatterResult(errors=[_ERR_NO_FRONTMATTER])
+
+    end_idx = content.find(delimiter, 3)  # type: ignore[arg-type]
+    if end_idx == -1:
+        return FrontmatterResult(errors=[_ERR_NO_CLOSING])
 
+    frontmatter = content[3:end_idx].strip()
+    if isinstance(frontmatter, bytes):
+        frontmatter = frontmatter.decode("utf-8")
+    return FrontmatterResult(data=frontmatter)
+
+
+def parse_frontmatter_fields(content: str | bytes) -> dict[str, Any]:
+    """Parse frontmatter and load it as YAML.
+
+    Uses PyYAML's libyaml-backed CSafeLoader when available, falling back
+    to the pure-Python SafeLoader.
+
+    Args:
+        content: The full markdown content with optional frontmatter.
+
+    Returns:
+        Parsed frontmatter dict, empty if missing or invalid.
+    """
+    result = parse_frontmatter(content)
+    if not result.success:
+        return {}
+
+    # Callers add keys (e.g. "plugin") and may edit nested values, so never
+    # hand out any part of the cached mapping
+    return copy.deepcopy(_load_yaml_block(result.data))
+
+
+@functools.lru_cache(maxsize=2048)
+def _load_yaml_block(data: str) -> dict[str, Any]:
+    """Load a frontmatter block as a YAML mapping.
+
+    Results are memoized because the TUI re-discovers every source on each
+    reload, parsing the same blocks again. Keyed on the block alone, so file
+    bodies are not kept alive by the cache.
+
+    Args:
+        data: The text between the frontmatter delimiters.
+
+    Returns:
+        Parsed mapping, empty if the YAML is invalid or not a mapping.
+    """
     try:
-        end_idx = content.index("---", 3)
-        frontmatter = content[3:end_idx].strip()
-        return FrontmatterResult(data=frontmatter)
-    except ValueError:
-        return FrontmatterResult(errors=["Invalid frontmatter: missing closing ---"])
+        loaded = yaml.load(data, Loader=_YamlLoader)
+    except yaml.YAMLError:
+        return {}
+    return loaded if isinstance(loaded, dict) else {}
@@ -87,135 +87,11 @@ def mock_filesystem() -> MagicMock:
     return fs
 
 
-# ============================================================================
-# Sample Content Fixtures
-# ============================================================================
-
-
-@pytest.fixture
-def sample_claude_agent_content() -> str:
-    """Sample Claude agent file content."""
-    return """---
-name: analyst
-description: Research and investigation specialist
-model: sonnet
----
-
-# Analyst Agent
-
-You are an analyst agent that investigates issues.
-
-## Capabilities
-
-- Research topics
-- Gather evidence
-- Provide analysis
-
-Use Task(subagent_type="implementer", prompt="Write code") for implementation.
-"""
-
-
-@pytest.fixture
-def sample_vscode_agent_content() -> str:
-    """Sample VS Code agent file content."""
-    return """---
-name: analyst
-description: Research and investigation specialist
-model: claude-sonnet-4-5
-tools:
-  - read
-  - edit
-  - shell
-  - search
----
-
-# Analyst Agent
-
-You are an analyst agent that investigates issues.
-
-## Capabilities
-
-- Research topics
-- Gather evidence
-- Provide analysis
-
-Use #runSubagent("implementer", "Write code") for implementation.
-"""
-
-
-@pytest.fixture
-def sample_copilot_agent_content() -> str:
-    """Sample Copilot agent file content."""
-    return """---
-name: analyst
-description: Research and investigation specialist
----
-
-# Analyst Agent
-
-You are an analyst agent that investigates issues.
-
-## Capabilities
-
-- Research topics
-- Gather evidence
-- Provide analysis
-"""
-
-
-@pytest.fixture
-def sample_codex_agent_content() -> str:
-    """Sample Codex agent file content."""
-    return """---
-name: analyst
-description: Research and investigation specialist
-model: o3
----
-
-# Analyst Agent
-
-You are an analyst agent that investigates issues.
-"""
-
-
-@pytest.fixture
-def sample_skill_content() -> str:
-    """Sample skill SKILL.md content."""
-    return """---
-name: github
-description: GitHub operations skill
----
-
-# GitHub Skill
-
-Provides GitHub operations like creating PRs, issues, and comments.
-
-## Commands
-
-- `/pr-create`: Create a pull request
-- `/issue-create`: Create an issue
-"""
-
-
 # ============================================================================
 # App Context Fixtures
 # ============================================================================
 
 
-@pytest.fixture
-def mock_app_context() -> MagicMock:
-    """Create a complete mock AppContext for CLI testing."""
-    from skill_installer.context import AppContext
-
-    ctx = MagicMock(spec=AppContext)
-    ctx.registry = MagicMock()
-    ctx.gitops = MagicMock()
-    ctx.discovery = MagicMock()
-    ctx.installer = MagicMock()
-    ctx.filesystem = MagicMock()
-    return ctx
-
-
 @pytest.fixture
 def mock_source() -> Any:
     """Create a mock Source object."""
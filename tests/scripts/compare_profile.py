@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Compare two profile_tui_startup.py --json runs and flag regressions.
+
+Run from project root:
+    uv run python tests/scripts/profile_tui_startup.py --json baseline.json
+    # ...make changes...
+    uv run python tests/scripts/profile_tui_startup.py --json current.json
+    uv run python tests/scripts/compare_profile.py baseline.json current.json
+
+Exits with status 1 when any step grew by more than --threshold percent.
+Steps missing from either run are listed but never fail the comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Default allowed growth per step before it counts as a regression
+DEFAULT_THRESHOLD_PCT = 15.0
+
+# Steps faster than this are dominated by timer noise and never fail
+MIN_WALL_NS = 1_000_000
+
+
+def load_timings(path: Path) -> dict[tuple[str, str], int]:
+    """Load a --json file keyed by (phase, step)."""
+    records = json.loads(path.read_text(encoding="utf-8"))
+    return {(r["phase"], r["step"]): r["wall_ns"] for r in records}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse comparison command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path, help="JSON from the reference run")
+    parser.add_argument("current", type=Path, help="JSON from the run under test")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD_PCT,
+        help=f"allowed growth in percent (default: {DEFAULT_THRESHOLD_PCT:g})",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Print a per-step comparison and return the exit status."""
+    args = parse_args()
+    baseline = load_timings(args.baseline)
+    current = load_timings(args.current)
+
+    regressions = 0
+    for key, base_ns in baseline.items():
+        phase, step = key
+        if key not in current:
+            print(f"  [MISSING] {phase}: {step}")
+            continue
+        cur_ns = current[key]
+        change = (cur_ns - base_ns) / base_ns * 100 if base_ns else 0.0
+        regressed = change > args.threshold and max(base_ns, cur_ns) >= MIN_WALL_NS
+        regressions += regressed
+        tag = "REGRESSED" if regressed else "ok"
+        print(
+            f"  [{tag}] {phase}: {step}: "
+            f"{base_ns / 1_000_000:.2f}ms -> {cur_ns / 1_000_000:.2f}ms ({change:+.1f}%)"
+        )
+    for phase, step in current.keys() - baseline.keys():
+        print(f"  [NEW] {phase}: {step}")
+
+    if regressions:
+        print(f"\n{regressions} step(s) grew more than {args.threshold:g}%")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,8 +15,11 @@ Target: 500 rows render in <1s
 
 from __future__ import annotations
 
+import locale
+import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import compress
 from typing import Any
 
 from textual import on
@@ -26,8 +29,35 @@ from textual.coordinate import Coordinate
 from textual.message import Message
 from textual.widgets import DataTable, Footer, Header, Static
 
-
-@dataclass
+# Terminal encoding is detected once per process; the dicts are never mutated
+try:
+    _ENCODING = getattr(sys.stdout, "encoding", None) or locale.getpreferredencoding()
+except (AttributeError, TypeError):
+    _ENCODING = "utf-8"  # Default to UTF-8 if detection fails
+_SUPPORTS_UTF8 = _ENCODING.lower() in ("utf-8", "utf8")
+
+_INDICATORS_UTF8 = {
+    "checked": "\u25c9",  # ◉
+    "installed": "\u25cf",  # ●
+    "unchecked": "\u25cb",  # ○
+}
+_INDICATORS_ASCII = {
+    "checked": "[x]",
+    "installed": "[*]",
+    "unchecked": "[ ]",
+}
+INDICATORS = _INDICATORS_UTF8 if _SUPPORTS_UTF8 else _INDICATORS_ASCII
+
+# Indicator by state bits (checked << 1) | installed; checked wins over installed
+_IND_TABLE = (
+    INDICATORS["unchecked"],
+    INDICATORS["installed"],
+    INDICATORS["checked"],
+    INDICATORS["checked"],
+)
+
+
+@dataclass(slots=True)
 class MockDisplayItem:
     """Mock item for validation testing."""
 
@@ -38,10 +68,10 @@ class MockDisplayItem:
     platforms: list[str]
     installed_platforms: list[str]
     relative_path: str = ""
+    unique_id: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self.source_name}/{self.item_type}/{self.name}"
+    def __post_init__(self) -> None:
+        self.unique_id = f"{self.source_name}/{self.item_type}/{self.name}"
 
 
 class ItemDataTable(DataTable):
@@ -72,33 +102,13 @@ class ItemDataTable(DataTable):
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.items: list[MockDisplayItem] = []
+        self._items_by_id: dict[str, MockDisplayItem] = {}
         self._checked: set[str] = set()
+        # Checked flags aligned with self.items; _checked stays canonical across set_items
+        self._checked_bits = bytearray()
         self.cursor_type = "row"
         self.zebra_stripes = True
-        self._indicators = self._get_terminal_indicators()
-
-    def _get_terminal_indicators(self) -> dict[str, str]:
-        """Detect UTF-8 support and return appropriate indicators."""
-        import locale
-        import sys
-
-        try:
-            encoding = getattr(sys.stdout, "encoding", None) or locale.getpreferredencoding()
-        except (AttributeError, TypeError):
-            encoding = "utf-8"  # Default to UTF-8 if detection fails
-        supports_utf8 = encoding.lower() in ("utf-8", "utf8")
-
-        if supports_utf8:
-            return {
-                "checked": "\u25c9",  # ◉
-                "installed": "\u25cf",  # ●
-                "unchecked": "\u25cb",  # ○
-            }
-        return {
-            "checked": "[x]",
-            "installed": "[*]",
-            "unchecked": "[ ]",
-        }
+        self._indicators = INDICATORS
 
     def on_mount(self) -> None:
         """Initialize table columns on mount."""
@@ -109,55 +119,61 @@ class ItemDataTable(DataTable):
         # Preserve checked state before clearing
         checked_ids = self._checked.copy()
 
-        self.clear()
-        self.items = items
-
-        # Bulk add rows for performance
-        rows = []
-        for item in items:
-            indicator = self._get_indicator(item, checked_ids)
-            name_source = f"{item.name} \u2022 {item.source_name}"
-            status = f"[{', '.join(item.installed_platforms)}]" if item.installed_platforms else ""
-            desc = (item.description or "No description")[:60]
-            rows.append((indicator, name_source, status, desc))
-
-        # Single bulk operation
-        for idx, row in enumerate(rows):
-            self.add_row(*row, key=items[idx].unique_id)
+        # Build each column as its own list, then zip them into rows
+        unique_ids = [item.unique_id for item in items]
+        checked_bits = bytearray(unique_id in checked_ids for unique_id in unique_ids)
+        indicators = [
+            _IND_TABLE[checked << 1 | bool(item.installed_platforms)]
+            for checked, item in zip(checked_bits, items, strict=True)
+        ]
+        name_sources = [f"{item.name} \u2022 {item.source_name}" for item in items]
+        statuses = [
+            f"[{', '.join(item.installed_platforms)}]" if item.installed_platforms else ""
+            for item in items
+        ]
+        descs = [(item.description or "No description")[:60] for item in items]
 
-        # Restore checked state
+        self.items = items
+        self._items_by_id = {item.unique_id: item for item in items}
         self._checked = checked_ids
-        self._sync_checked_state_with_display()
+        self._checked_bits = checked_bits
+
+        # DataTable.add_rows cannot assign row keys, so add keyed rows inside
+        # one batch_update to defer relayout/repaint until every row is in place
+        with self.app.batch_update():
+            self.clear()
+            add_row = self.add_row
+            for indicator, name_source, status, desc, key in zip(
+                indicators, name_sources, statuses, descs, unique_ids, strict=True
+            ):
+                add_row(indicator, name_source, status, desc, key=key)
+            self._sync_checked_state_with_display()
 
     def _get_indicator(self, item: MockDisplayItem, checked_set: set[str] | None = None) -> str:
         """Get the indicator for an item."""
         check_set = checked_set if checked_set is not None else self._checked
-        if item.unique_id in check_set:
-            return self._indicators["checked"]
-        if item.installed_platforms:
-            return self._indicators["installed"]
-        return self._indicators["unchecked"]
+        return _IND_TABLE[(item.unique_id in check_set) << 1 | bool(item.installed_platforms)]
 
     def _sync_checked_state_with_display(self) -> None:
-        """Synchronize checked indicators with _checked set."""
-        for idx, item in enumerate(self.items):
-            if item.unique_id in self._checked:
-                coord = Coordinate(idx, 0)
-                if coord.row < self.row_count:
-                    self.update_cell_at(coord, self._indicators["checked"])
+        """Synchronize checked indicators with the checked bitmap."""
+        bits = self._checked_bits
+        for idx in compress(range(len(bits)), bits):
+            if idx < self.row_count:
+                self.update_cell_at(Coordinate(idx, 0), self._indicators["checked"])
 
     def get_checked_items(self) -> list[MockDisplayItem]:
         """Get all currently checked items."""
-        return [item for item in self.items if item.unique_id in self._checked]
+        return list(compress(self.items, self._checked_bits))
 
     def clear_checked(self) -> None:
         """Clear all checked items."""
         self._checked.clear()
-        for idx, item in enumerate(self.items):
-            coord = Coordinate(idx, 0)
-            if coord.row < self.row_count:
-                indicator = self._get_indicator(item)
-                self.update_cell_at(coord, indicator)
+        # Only rows that were checked need their indicator reset
+        bits = self._checked_bits
+        for idx in compress(range(len(bits)), bits):
+            if idx < self.row_count:
+                self.update_cell_at(Coordinate(idx, 0), self._get_indicator(self.items[idx]))
+        self._checked_bits = bytearray(len(self.items))
 
     def action_toggle(self) -> None:
         """Toggle the checked state of the current row."""
@@ -178,6 +194,7 @@ class ItemDataTable(DataTable):
         else:
             self._checked.add(unique_id)
             new_checked = True
+        self._checked_bits[row_idx] = new_checked
 
         # Update indicator
         coord = Coordinate(row_idx, 0)
@@ -195,10 +212,7 @@ class ItemDataTable(DataTable):
             return
 
         # Find item by row key
-        item = next(
-            (item for item in self.items if item.unique_id == str(row_key.value)),
-            None,
-        )
+        item = self._items_by_id.get(str(row_key.value))
         if item:
             self.post_message(self.ItemSelected(item))
 
@@ -315,9 +329,6 @@ class SpikeApp(App):
 
 def run_headless_benchmark() -> dict:
     """Run headless benchmark for CI validation."""
-    import locale
-    import sys
-
     print("DataTable Validation Spike - Headless Benchmark")
     print("=" * 60)
 
@@ -348,7 +359,6 @@ def run_headless_benchmark() -> dict:
 
     # Instantiate table directly (not mounted)
     table = ItemDataTable()
-    table._indicators = table._get_terminal_indicators()
 
     print(f"Indicators: {table._indicators}")
 
@@ -394,8 +404,6 @@ def run_headless_benchmark() -> dict:
 
 
 if __name__ == "__main__":
-    import sys
-
     if "--headless" in sys.argv:
         results = run_headless_benchmark()
         sys.exit(0 if results["pass"] else 1)
@@ -5,36 +5,178 @@ Run from project root:
     uv run python tests/scripts/profile_tui_startup.py
 
 Outputs timing for each phase of TUI initialization without launching
-the interactive UI.
+the interactive UI. Phases report the cold first call and, where the call
+can safely be repeated, the warm steady-state minimum of WARM_REPEATS runs.
+
+Set SKILL_INSTALLER_WARMUP=1 to import every profiled module before the
+first phase, so import cost is excluded from all phase timings.
+
+Pass --overlap to first measure update_stale_sources() running
+concurrently with the SkillInstallerApp import (later import timings are
+then warm).
+
+Pass --profile-dir DIR to capture a call profile of each phase:
+    --backend cprofile     phaseN.prof (open with snakeviz) + top functions
+    --backend pyinstrument phaseN.html call tree (requires pyinstrument)
+
+Pass --json PATH to also write every timing as a list of
+{"phase", "step", "wall_ns"} records; compare two such files with
+tests/scripts/compare_profile.py to catch regressions.
 """
 
 from __future__ import annotations
 
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import subprocess
+import sys
 import time
+import timeit
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
+
+# Runs per warm (steady-state) measurement; the minimum is reported
+WARM_REPEATS = 5
+
+# Every reported timing, written out by --json
+RESULTS: list[dict[str, Any]] = []
+
+
+def format_ns(elapsed_ns: int) -> str:
+    """Format a perf_counter_ns delta, in microseconds below 10ms."""
+    if elapsed_ns < 10_000_000:
+        return f"{elapsed_ns / 1_000:.0f}us"
+    return f"{elapsed_ns / 1_000_000_000:.2f}s"
+
+
+def report(phase: str, step: str, wall_ns: int, detail: str = "") -> None:
+    """Print a timing and record it for --json output."""
+    RESULTS.append({"phase": phase, "step": step, "wall_ns": wall_ns})
+    print(f"  {step}: {format_ns(wall_ns)}{detail}")
+
+
+def report_warm(phase: str, label: str, func: Callable[[], Any]) -> None:
+    """Time repeated calls to an already-warmed function and report the best run."""
+    timer = timeit.Timer(func, timer=time.perf_counter_ns)
+    best = min(timer.repeat(number=1, repeat=WARM_REPEATS))
+    report(phase, f"{label} (warm, min of {WARM_REPEATS})", int(best))
+
 
+def warm_up_imports() -> None:
+    """Import every module the phases touch so import cost is paid up front."""
+    import skill_installer.context  # noqa: F401
+    import skill_installer.tui.app  # noqa: F401
+    import skill_installer.tui.data_manager  # noqa: F401
+
+    print("  Warm-up: profiled modules imported before timing")
+
+
+def profile_overlapped_startup() -> None:
+    """Profile stale-source updates overlapped with the TUI app import.
+
+    update_stale_sources is I/O bound (git fetches) and the app import is
+    independent of it, so a real startup could run them concurrently.
+    """
+    print("=" * 60)
+    print("PHASE 0: Overlapped Startup (--overlap)")
+    print("=" * 60)
+
+    from skill_installer.context import create_context
+    from skill_installer.tui.data_manager import DataManager
+
+    ctx = create_context()
+    dm = DataManager(
+        registry_manager=ctx.registry,
+        gitops=ctx.gitops,
+        discovery=ctx.discovery,
+    )
 
-def profile_imports() -> float:
-    """Profile import times."""
+    def import_app() -> None:
+        import skill_installer.tui.app  # noqa: F401
+
+    def timed(func: Callable[[], Any]) -> int:
+        start = time.perf_counter_ns()
+        func()
+        return time.perf_counter_ns() - start
+
+    start = time.perf_counter_ns()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = {
+            pool.submit(timed, dm.update_stale_sources): "update_stale_sources()",
+            pool.submit(timed, import_app): "Import SkillInstallerApp",
+        }
+        for future in as_completed(futures):
+            report("overlap", futures[future], future.result())
+    report("overlap", "Overlapped wall time", time.perf_counter_ns() - start)
+    print()
+
+
+def profile_imports() -> int:
+    """Profile import times.
+
+    The tui package defers Textual-backed exports until first attribute
+    access, so the package import and the first SkillInstallerApp lookup
+    are timed separately.
+    """
     print("=" * 60)
     print("PHASE 1: Imports")
     print("=" * 60)
 
-    start = time.time()
+    start = time.perf_counter_ns()
     from skill_installer.context import create_context  # noqa: F401
 
-    elapsed = time.time() - start
-    print(f"  Import create_context: {elapsed:.2f}s")
+    elapsed = time.perf_counter_ns() - start
+    report("imports", "Import create_context", elapsed)
 
-    start = time.time()
-    from skill_installer.tui.app import SkillInstallerApp  # noqa: F401
+    start = time.perf_counter_ns()
+    import skill_installer.tui as tui_package
 
-    elapsed = time.time() - start
-    print(f"  Import SkillInstallerApp: {elapsed:.2f}s")
+    elapsed = time.perf_counter_ns() - start
+    report("imports", "Import skill_installer.tui (lazy stub)", elapsed)
 
-    return time.time()
+    start = time.perf_counter_ns()
+    tui_package.SkillInstallerApp  # noqa: B018 - first access triggers the deferred import
+    elapsed = time.perf_counter_ns() - start
+    report("imports", "First SkillInstallerApp access", elapsed)
 
+    profile_import_tree("skill_installer.tui.app")
 
-def profile_context_creation() -> tuple[float, object]:
+    return time.perf_counter_ns()
+
+
+def profile_import_tree(module: str, top: int = 10) -> None:
+    """Print the slowest modules from a cold ``-X importtime`` import.
+
+    Runs in a fresh interpreter so modules already imported by this
+    process do not hide their cost.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    timings: list[tuple[int, str]] = []
+    for line in result.stderr.splitlines():
+        # Format: "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        timings.append((int(cumulative), name.strip()))
+
+    print(f"  Slowest imports under {module} (-X importtime, cumulative):")
+    for cumulative_us, name in sorted(timings, reverse=True)[:top]:
+        print(f"    {cumulative_us / 1_000_000:.3f}s  {name}")
+
+
+def profile_context_creation() -> tuple[int, object]:
     """Profile context/service creation."""
     print("\n" + "=" * 60)
     print("PHASE 2: Context Creation")
@@ -42,16 +184,21 @@ def profile_context_creation() -> tuple[float, object]:
 
     from skill_installer.context import create_context
 
-    start = time.time()
+    start = time.perf_counter_ns()
     ctx = create_context()
-    elapsed = time.time() - start
-    print(f"  create_context(): {elapsed:.2f}s")
+    elapsed = time.perf_counter_ns() - start
+    report("context", "create_context()", elapsed)
+    report_warm("context", "create_context()", create_context)
 
-    return time.time(), ctx
+    return time.perf_counter_ns(), ctx
 
 
-def profile_data_loading(ctx: object) -> float:
-    """Profile data loading operations."""
+def profile_data_loading(ctx: object) -> tuple[int, list[Any]]:
+    """Profile data loading operations.
+
+    Returns:
+        Tuple of (end perf_counter_ns, discovered items) so later phases reuse the load.
+    """
     print("\n" + "=" * 60)
     print("PHASE 3: Data Loading")
     print("=" * 60)
@@ -64,48 +211,67 @@ def profile_data_loading(ctx: object) -> float:
         discovery=ctx.discovery,  # type: ignore[attr-defined]
     )
 
-    start = time.time()
+    # Wall time well above CPU time means the call is blocked on I/O
+    start = time.perf_counter_ns()
+    cpu_start = time.process_time_ns()
     dm.update_stale_sources()
-    elapsed = time.time() - start
-    print(f"  update_stale_sources(): {elapsed:.2f}s")
+    cpu = time.process_time_ns() - cpu_start
+    elapsed = time.perf_counter_ns() - start
+    report("data", "update_stale_sources()", elapsed, f" wall, {format_ns(cpu)} CPU")
 
-    start = time.time()
+    start = time.perf_counter_ns()
+    cpu_start = time.process_time_ns()
     discovered, installed, sources, status = dm.load_all_data()
-    elapsed = time.time() - start
-    print(f"  load_all_data(): {elapsed:.2f}s")
+    cpu = time.process_time_ns() - cpu_start
+    elapsed = time.perf_counter_ns() - start
+    report("data", "load_all_data()", elapsed, f" wall, {format_ns(cpu)} CPU")
+    # update_stale_sources is not repeated: it may fetch from remotes
+    report_warm("data", "load_all_data()", dm.load_all_data)
     print(f"    - {len(discovered)} discovered items")
     print(f"    - {len(installed)} installed items")
     print(f"    - {len(sources)} sources")
 
-    return time.time()
+    return time.perf_counter_ns(), discovered
+
 
+def profile_widget_creation(discovered: list[Any]) -> int:
+    """Profile widget/row creation (without mounting).
 
-def profile_widget_creation(ctx: object) -> float:
-    """Profile widget/row creation (without mounting)."""
+    Args:
+        discovered: Items loaded in the data loading phase.
+    """
     print("\n" + "=" * 60)
     print("PHASE 4: Widget Creation (simulation)")
     print("=" * 60)
 
-    from skill_installer.tui.data_manager import DataManager
-
-    dm = DataManager(
-        registry_manager=ctx.registry,  # type: ignore[attr-defined]
-        gitops=ctx.gitops,  # type: ignore[attr-defined]
-        discovery=ctx.discovery,  # type: ignore[attr-defined]
-    )
-    discovered, _, _, _ = dm.load_all_data()
-
     # Simulate DataTable row creation (no widget per row, just data)
-    start = time.time()
     # Prepare rows without mounting (since we're not in Textual context)
-    rows = []
-    for item in discovered:
-        name_source = f"{item.name} • {item.source_name}"
-        status = f"[{', '.join(item.installed_platforms)}]" if item.installed_platforms else ""
-        desc = (item.description or "No description")[:60]
-        rows.append(("○", name_source, status, desc))
-    elapsed = time.time() - start
-    print(f"  Prepare {len(rows)} DataTable rows: {elapsed:.2f}s")
+    get_fields = attrgetter("name", "source_name", "installed_platforms", "description")
+    # ItemDataTable.set_items reads the column text DisplayItem precomputes
+    get_columns = attrgetter("display_name_source", "display_status", "display_description")
+
+    def build_formatted() -> list[tuple[str, ...]]:
+        return [
+            (
+                "○",
+                f"{name} • {source}",
+                f"[{', '.join(platforms)}]" if platforms else "",
+                (desc or "No description")[:60],
+            )
+            for name, source, platforms, desc in map(get_fields, discovered)
+        ]
+
+    def build_precomputed() -> list[tuple[str, ...]]:
+        return [("○", *columns) for columns in map(get_columns, discovered)]
+
+    start = time.perf_counter_ns()
+    rows = build_formatted()
+    elapsed = time.perf_counter_ns() - start
+    # Row counts stay out of step names so runs on different data compare
+    print(f"  Preparing {len(rows)} DataTable rows")
+    report("widgets", "Prepare rows (format per row)", elapsed)
+    report_warm("widgets", "Prepare rows (format per row)", build_formatted)
+    report_warm("widgets", "Prepare rows (precomputed columns)", build_precomputed)
 
     # DataTable uses virtualization - only visible rows are widgets
     visible_rows = 30  # Approximate visible rows in typical terminal
@@ -114,30 +280,107 @@ def profile_widget_creation(ctx: object) -> float:
     print(f"  Estimated visible widgets: {total_widgets} (virtualized)")
     print(f"  [OLD: Would have been {len(rows) * 5} widgets with ItemRow]")
 
-    return time.time()
+    return time.perf_counter_ns()
+
+
+@contextmanager
+def capture_phase(phase: int, backend: str, profile_dir: Path | None) -> Iterator[None]:
+    """Capture a call profile of the enclosed phase when profile_dir is set."""
+    if profile_dir is None:
+        yield
+        return
+
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    if backend == "pyinstrument":
+        from pyinstrument import Profiler
+
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            out_path = profile_dir / f"phase{phase}.html"
+            out_path.write_text(profiler.output_html())
+            print(f"  Call tree: {out_path}")
+        return
+
+    with cProfile.Profile() as profile:
+        yield
+    out_path = profile_dir / f"phase{phase}.prof"
+    profile.dump_stats(out_path)
+    print(f"  Profile: {out_path} (top functions by cumulative time)")
+    pstats.Stats(profile).sort_stats("cumulative").print_stats(15)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse profiler command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--overlap",
+        action="store_true",
+        help="measure update_stale_sources overlapped with the app import first",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=None,
+        help="write a call profile of each phase into this directory",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("cprofile", "pyinstrument"),
+        default="cprofile",
+        help="profiler used with --profile-dir (default: cprofile)",
+    )
+    parser.add_argument(
+        "--json",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="write all timings as JSON records for compare_profile.py",
+    )
+    return parser.parse_args()
 
 
 def main() -> None:
     """Run all profiling phases."""
+    args = parse_args()
+
     print("\nTUI STARTUP PROFILER")
     print("=" * 60)
 
-    overall_start = time.time()
+    overall_start = time.perf_counter_ns()
 
-    profile_imports()
-    _, ctx = profile_context_creation()
-    profile_data_loading(ctx)
-    profile_widget_creation(ctx)
+    if os.environ.get("SKILL_INSTALLER_WARMUP") == "1":
+        warm_up_imports()
+
+    if args.overlap:
+        profile_overlapped_startup()
+
+    with capture_phase(1, args.backend, args.profile_dir):
+        profile_imports()
+    with capture_phase(2, args.backend, args.profile_dir):
+        _, ctx = profile_context_creation()
+    with capture_phase(3, args.backend, args.profile_dir):
+        _, discovered = profile_data_loading(ctx)
+    with capture_phase(4, args.backend, args.profile_dir):
+        profile_widget_creation(discovered)
 
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    print(f"  Total profiling time: {time.time() - overall_start:.2f}s")
+    report("summary", "Total profiling time", time.perf_counter_ns() - overall_start)
     print("\n  NOTE: This does NOT include Textual's layout/CSS/render time.")
     print("  The actual app.run() will take significantly longer due to")
     print("  Textual processing all widgets for layout and rendering.")
     print("\n  Use profile_tui_interactive.sh to measure full startup time.")
 
+    if args.json is not None:
+        with args.json.open("w", encoding="utf-8") as f:
+            json.dump(RESULTS, f, indent=2)
+        print(f"\n  Timings written to {args.json}")
+
 
 if __name__ == "__main__":
     main()
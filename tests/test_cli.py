@@ -8,7 +8,8 @@ without mocking module-level imports.
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from typing import Final
 from unittest.mock import MagicMock
 
 import pytest
@@ -17,15 +18,21 @@ import typer
 from skill_installer import cli
 from skill_installer.context import AppContext
 from skill_installer.discovery import DiscoveredItem
+from skill_installer.gitops import GitOpsError
 from skill_installer.registry import InstalledItem, Source
 from skill_installer.types import InstallResult
 
+# Fake paths are built once and shared; pure paths where no filesystem call occurs
+FAKE_REGISTRY_DIR: Final = PurePosixPath("/fake/registry")
+FAKE_REPO_DIR: Final = Path("/fake/repo")  # cli checks .exists() on repo paths
+FAKE_INSTALLED_PATH: Final = PurePosixPath("/installed/path")
+
 
 @pytest.fixture
 def mock_registry() -> MagicMock:
     """Create a mock RegistryManager."""
     registry = MagicMock()
-    registry.registry_dir = Path("/fake/registry")
+    registry.registry_dir = FAKE_REGISTRY_DIR
     return registry
 
 
@@ -173,9 +180,34 @@ class TestSourceCommands:
         # Act
         cli.source_update(name=None, _context=mock_context)
 
-        # Assert
-        assert mock_context.gitops.clone_or_fetch.call_count == 2
-        assert mock_context.registry.update_source_sync_time.call_count == 2
+        # Assert - fetches run concurrently, so call order is not guaranteed
+        fetch_calls = mock_context.gitops.clone_or_fetch.call_args_list
+        assert sorted(c.args[1] for c in fetch_calls) == ["source1", "source2"]
+        assert [
+            c.args[0] for c in mock_context.registry.update_source_sync_time.call_args_list
+        ] == [
+            "source1",
+            "source2",
+        ]
+
+    def test_source_update_failure_skips_sync_time(self, mock_context: AppContext) -> None:
+        """Test a failed fetch does not record a sync time for that source."""
+        sources = [
+            Source(name="source1", url="https://github.com/test/repo1"),
+            Source(name="source2", url="https://github.com/test/repo2"),
+        ]
+        mock_context.registry.list_sources.return_value = sources
+
+        def clone_or_fetch(url: str, name: str, ref: str) -> Path:
+            if name == "source1":
+                raise GitOpsError("network down")
+            return FAKE_REPO_DIR
+
+        mock_context.gitops.clone_or_fetch.side_effect = clone_or_fetch
+
+        cli.source_update(name=None, _context=mock_context)
+
+        mock_context.registry.update_source_sync_time.assert_called_once_with("source2")
 
     def test_source_update_specific(self, mock_context: AppContext) -> None:
         """Test updating a specific source."""
@@ -352,7 +384,7 @@ class TestInstallCommand:
         """Test install with unknown item."""
         source = Source(name="test-source", url="https://github.com/test/repo")
         mock_context.registry.get_source.return_value = source
-        mock_context.gitops.get_repo_path.return_value = Path("/fake/repo")
+        mock_context.gitops.get_repo_path.return_value = FAKE_REPO_DIR
         mock_context.discovery.discover_all.return_value = []
 
         with pytest.raises(typer.Exit) as exc_info:
@@ -366,13 +398,13 @@ class TestInstallCommand:
         """Test successful installation."""
         source = Source(name="test-source", url="https://github.com/test/repo")
         mock_context.registry.get_source.return_value = source
-        mock_context.gitops.get_repo_path.return_value = Path("/fake/repo")
+        mock_context.gitops.get_repo_path.return_value = FAKE_REPO_DIR
 
         item = DiscoveredItem(
             name="test-agent",
             item_type="agent",
             description="Test agent",
-            path=Path("/fake/repo/test-agent.md"),
+            path=FAKE_REPO_DIR / "test-agent.md",
             platforms=["claude"],
         )
         mock_context.discovery.discover_all.return_value = [item]
@@ -380,7 +412,7 @@ class TestInstallCommand:
             success=True,
             item_id="test-source/agent/test-agent",
             platform="claude",
-            installed_path=Path("/installed/path"),
+            installed_path=FAKE_INSTALLED_PATH,
         )
 
         cli.install(
@@ -405,7 +437,8 @@ class TestSyncCommand:
 
         cli.sync(_context=mock_context)
 
-        assert mock_context.gitops.clone_or_fetch.call_count == 2
+        fetch_calls = mock_context.gitops.clone_or_fetch.call_args_list
+        assert sorted(c.args[1] for c in fetch_calls) == ["source1", "source2"]
 
     def test_sync_updates_installed_items(self, mock_context: AppContext) -> None:
         """Test sync checks and updates installed items."""
@@ -424,13 +457,13 @@ class TestSyncCommand:
             installedAt=datetime.now(timezone.utc),
         )
         mock_context.registry.list_installed.return_value = [installed]
-        mock_context.gitops.get_repo_path.return_value = Path("/fake/repo")
+        mock_context.gitops.get_repo_path.return_value = FAKE_REPO_DIR
 
         item = DiscoveredItem(
             name="test",
             item_type="agent",
             description="Test",
-            path=Path("/fake/repo/test.md"),
+            path=FAKE_REPO_DIR / "test.md",
             platforms=["claude"],
         )
         mock_context.discovery.discover_all.return_value = [item]
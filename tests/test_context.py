@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 from skill_installer.context import AppContext, create_context
 
@@ -13,11 +13,12 @@ class TestAppContext:
 
     def test_create_with_all_dependencies(self) -> None:
         """Test creating context with all dependencies."""
-        registry = MagicMock()
-        gitops = MagicMock()
-        discovery = MagicMock()
-        installer = MagicMock()
-        filesystem = MagicMock()
+        # Only identity is checked, so plain namespaces stand in for mocks
+        registry = SimpleNamespace()
+        gitops = SimpleNamespace()
+        discovery = SimpleNamespace()
+        installer = SimpleNamespace()
+        filesystem = SimpleNamespace()
         ctx = AppContext(
             registry=registry,
             gitops=gitops,
@@ -35,10 +36,10 @@ class TestAppContext:
         """Test context creates default filesystem if not provided."""
         from skill_installer.filesystem import RealFileSystem
 
-        registry = MagicMock()
-        gitops = MagicMock()
-        discovery = MagicMock()
-        installer = MagicMock()
+        registry = SimpleNamespace()
+        gitops = SimpleNamespace()
+        discovery = SimpleNamespace()
+        installer = SimpleNamespace()
         ctx = AppContext(
             registry=registry,
             gitops=gitops,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -15,11 +16,25 @@ def discovery() -> Discovery:
     return Discovery()
 
 
-@pytest.fixture
-def sample_repo(tmp_path: Path) -> Path:
-    """Create a sample repository structure."""
+def _snapshot_tree(root: Path) -> dict[str, str]:
+    """Map each file under root to its content, for detecting mutation."""
+    return {
+        path.relative_to(root).as_posix(): path.read_text()
+        for path in root.rglob("*")
+        if path.is_file()
+    }
+
+
+@pytest.fixture(scope="module")
+def sample_repo(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Create a sample repository structure.
+
+    Built once per module; tests must only read from it.
+    """
+    root = tmp_path_factory.mktemp("sample_repo")
+
     # Create agents directory
-    agents_dir = tmp_path / "src" / "claude"
+    agents_dir = root / "src" / "claude"
     agents_dir.mkdir(parents=True)
     (agents_dir / "analyst.md").write_text(
         """---
@@ -34,7 +49,7 @@ Investigates issues and gathers evidence.
     )
 
     # Create VS Code agents
-    vscode_dir = tmp_path / "src" / "vs-code-agents"
+    vscode_dir = root / "src" / "vs-code-agents"
     vscode_dir.mkdir(parents=True)
     (vscode_dir / "analyst.agent.md").write_text(
         """---
@@ -50,7 +65,7 @@ tools:
     )
 
     # Create skills directory
-    skills_dir = tmp_path / ".claude" / "skills" / "github"
+    skills_dir = root / ".claude" / "skills" / "github"
     skills_dir.mkdir(parents=True)
     (skills_dir / "SKILL.md").write_text(
         """---
@@ -65,7 +80,7 @@ Provides GitHub operations.
     )
 
     # Create commands directory
-    commands_dir = tmp_path / ".claude" / "commands"
+    commands_dir = root / ".claude" / "commands"
     commands_dir.mkdir(parents=True)
     (commands_dir / "commit.md").write_text(
         """---
@@ -77,7 +92,9 @@ description: Create a git commit
 """
     )
 
-    return tmp_path
+    snapshot = _snapshot_tree(root)
+    yield root
+    assert _snapshot_tree(root) == snapshot, "a test mutated the shared sample_repo"
 
 
 class TestDiscovery:
@@ -120,6 +137,37 @@ class TestDiscovery:
         assert items[0].name == "commit"
         assert items[0].item_type == "command"
 
+    def test_find_markdown_files_prunes_skip_dirs(
+        self, discovery: Discovery, tmp_path: Path
+    ) -> None:
+        """Test markdown files under skipped directories are not listed."""
+        kept = tmp_path / "agents" / "kept.agent.md"
+        kept.parent.mkdir()
+        kept.write_text("---\nname: kept\n---\n")
+        skipped = tmp_path / "node_modules" / "pkg" / "skipped.agent.md"
+        skipped.parent.mkdir(parents=True)
+        skipped.write_text("---\nname: skipped\n---\n")
+        (tmp_path / "agents" / "notes.txt").write_text("not markdown")
+
+        assert discovery._find_markdown_files(tmp_path) == [kept]
+
+    def test_discover_commands_requires_claude_commands_dir(
+        self, discovery: Discovery, tmp_path: Path
+    ) -> None:
+        """Test commands are only found directly inside .claude/commands."""
+        frontmatter = "---\nname: {}\n---\n"
+        nested = tmp_path / "plugin" / ".claude" / "commands"
+        nested.mkdir(parents=True)
+        (nested / "deploy.md").write_text(frontmatter.format("deploy"))
+        (nested / "sub").mkdir()
+        (nested / "sub" / "deeper.md").write_text(frontmatter.format("deeper"))
+        (tmp_path / "commands").mkdir()
+        (tmp_path / "commands" / "other.md").write_text(frontmatter.format("other"))
+
+        items = discovery._auto_discover_commands(tmp_path)
+
+        assert [item.name for item in items] == ["deploy"]
+
     def test_parse_frontmatter(self, discovery: Discovery) -> None:
         """Test parsing YAML frontmatter."""
         content = """---
@@ -195,6 +243,18 @@ Content
         assert item is not None
         assert item.name == "my-agent"
 
+    def test_parse_skips_undecodable_body(self, discovery: Discovery, tmp_path: Path) -> None:
+        """Test that files whose body is not UTF-8 are skipped, not just their frontmatter."""
+        payload = b"---\nname: broken\n---\n\nBody \xff\xfe\n"
+        agent_file = tmp_path / "broken.md"
+        agent_file.write_bytes(payload)
+        skill_dir = tmp_path / "broken-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_bytes(payload)
+
+        assert discovery._parse_agent_file(agent_file, "agent") is None
+        assert discovery._parse_skill_dir(skill_dir) is None
+
 
 class TestDiscoveredItem:
     """Tests for DiscoveredItem dataclass."""
@@ -225,11 +285,16 @@ class TestDiscoveredItem:
         assert item.frontmatter == {}
 
 
-@pytest.fixture
-def marketplace_repo(tmp_path: Path) -> Path:
-    """Create a marketplace-enabled repository structure."""
+@pytest.fixture(scope="module")
+def marketplace_repo(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Create a marketplace-enabled repository structure.
+
+    Built once per module; tests must only read from it.
+    """
+    root = tmp_path_factory.mktemp("marketplace_repo")
+
     # Create .claude-plugin directory with marketplace.json
-    plugin_dir = tmp_path / ".claude-plugin"
+    plugin_dir = root / ".claude-plugin"
     plugin_dir.mkdir(parents=True)
     (plugin_dir / "marketplace.json").write_text(
         """{
@@ -264,7 +329,7 @@ def marketplace_repo(tmp_path: Path) -> Path:
     )
 
     # Create skills directories
-    pdf_skill = tmp_path / "skills" / "pdf"
+    pdf_skill = root / "skills" / "pdf"
     pdf_skill.mkdir(parents=True)
     (pdf_skill / "SKILL.md").write_text(
         """---
@@ -279,7 +344,7 @@ Process PDF files.
 """
     )
 
-    docx_skill = tmp_path / "skills" / "docx"
+    docx_skill = root / "skills" / "docx"
     docx_skill.mkdir(parents=True)
     (docx_skill / "SKILL.md").write_text(
         """---
@@ -294,7 +359,7 @@ Process Word documents.
     )
 
     # Create agents directory
-    agents_dir = tmp_path / "agents"
+    agents_dir = root / "agents"
     agents_dir.mkdir(parents=True)
     (agents_dir / "pdf-agent.md").write_text(
         """---
@@ -307,7 +372,7 @@ description: PDF processing agent
     )
 
     # Create commands directory
-    commands_dir = tmp_path / "commands"
+    commands_dir = root / "commands"
     commands_dir.mkdir(parents=True)
     (commands_dir / "pdf-process.md").write_text(
         """---
@@ -319,7 +384,9 @@ description: Process PDF command
 """
     )
 
-    return tmp_path
+    snapshot = _snapshot_tree(root)
+    yield root
+    assert _snapshot_tree(root) == snapshot, "a test mutated the shared marketplace_repo"
 
 
 class TestMarketplaceDiscovery:
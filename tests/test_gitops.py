@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from skill_installer.gitops import CACHE_DIR, GitOps, GitOpsError
+from skill_installer.gitops import CACHE_DIR, HASH_CHUNK_SIZE, GitOps, GitOpsError
 
 
 @pytest.fixture
@@ -74,6 +75,27 @@ class TestGitOps:
 
         assert temp_gitops.get_file_hash(test_file1) != temp_gitops.get_file_hash(test_file2)
 
+    def test_get_file_hash_spans_chunks(self, temp_gitops: GitOps, tmp_path: Path) -> None:
+        """Test files larger than one read chunk hash like the whole content."""
+        content = bytes(range(256)) * (HASH_CHUNK_SIZE // 128 + 1)
+        test_file = tmp_path / "large.bin"
+        test_file.write_bytes(content)
+
+        assert temp_gitops.get_file_hash(test_file) == hashlib.sha256(content).hexdigest()
+
+    def test_get_tree_hash_concatenates_sorted_files(
+        self, temp_gitops: GitOps, tmp_path: Path
+    ) -> None:
+        """Test tree hash covers file contents in sorted path order."""
+        test_dir = tmp_path / "test_dir"
+        (test_dir / "sub").mkdir(parents=True)
+        (test_dir / "b.txt").write_text("second")
+        (test_dir / "a.txt").write_text("first")
+        (test_dir / "sub" / "c.txt").write_text("third")
+
+        expected = hashlib.sha256(b"firstsecondthird").hexdigest()
+        assert temp_gitops.get_tree_hash(test_dir) == expected
+
     def test_get_tree_hash_file(self, temp_gitops: GitOps, tmp_path: Path) -> None:
         """Test getting hash for a single file."""
         test_file = tmp_path / "test.txt"
@@ -276,6 +298,15 @@ class TestGitOps:
         license_text = temp_gitops.get_license("test-repo")
         assert license_text is None
 
+    def test_get_license_prefers_earlier_pattern(self, temp_gitops: GitOps) -> None:
+        """Test LICENSE wins over COPYING and directories are ignored."""
+        repo_path = temp_gitops.cache_dir / "test-repo"
+        (repo_path / "LICENSE.md").mkdir(parents=True)
+        (repo_path / "COPYING").write_text("GPL v3")
+        (repo_path / "LICENSE.txt").write_text("MIT License")
+
+        assert temp_gitops.get_license("test-repo") == "MIT License"
+
     def test_get_license_various_patterns(self, temp_gitops: GitOps, tmp_path: Path) -> None:
         """Test various license file patterns."""
         repo_path = temp_gitops.cache_dir / "test-repo"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 from pathlib import Path
 from unittest.mock import patch
 
@@ -128,6 +129,18 @@ class TestInstallResult:
                 installed_path=None,
             )
 
+    def test_result_is_immutable(self, tmp_path: Path) -> None:
+        """InstallResult is frozen and has no instance __dict__."""
+        result = InstallResult(
+            success=True,
+            item_id="source/agent/test",
+            platform="claude",
+            installed_path=tmp_path / "test.md",
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.success = False  # type: ignore[misc]
+        assert not hasattr(result, "__dict__")
+
     def test_empty_item_id_raises(self) -> None:
         """Creating InstallResult with empty item_id raises ValueError."""
         with pytest.raises(ValueError, match="item_id cannot be empty"):
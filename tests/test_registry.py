@@ -365,7 +365,7 @@ class TestMarketplaceManifest:
         """Test loading MarketplaceManifest from invalid JSON."""
         manifest_file = tmp_path / "invalid.json"
         manifest_file.write_text("{ invalid json }")
-        with pytest.raises(json.JSONDecodeError):
+        with pytest.raises(ValueError):
             MarketplaceManifest.from_file(manifest_file)
 
 
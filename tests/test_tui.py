@@ -9,6 +9,8 @@ from unittest.mock import patch
 import pytest
 from textual.app import App, ComposeResult
 from textual.containers import Container
+from textual.coordinate import Coordinate
+from textual.widgets import Static
 
 from skill_installer.discovery import DiscoveredItem
 from skill_installer.tui import (
@@ -16,6 +18,7 @@ from skill_installer.tui import (
     ConfirmationScreen,
     DisplayItem,
     DisplaySource,
+    ItemDataTable,
     LocationOption,
     LocationSelectionScreen,
     SkillInstallerApp,
@@ -193,6 +196,13 @@ class TestSanitizeTerminalText:
         text = "normal\x1b_application-data\x1b\\content"
         assert sanitize_terminal_text(text) == "normalcontent"
 
+    def test_repeated_calls_hit_cache(self) -> None:
+        """Repeated sanitization of the same text is served from the cache."""
+        sanitize_terminal_text.cache_clear()
+        sanitize_terminal_text("claude", max_length=20)
+        sanitize_terminal_text("claude", max_length=20)
+        assert sanitize_terminal_text.cache_info().hits == 1
+
 
 class TestGetTerminalIndicators:
     """Tests for get_terminal_indicators encoding detection (CRITICAL-002)."""
@@ -252,6 +262,56 @@ class TestGetTerminalIndicators:
                 assert "unchecked" in indicators
 
 
+class TestDisplayItem:
+    """Tests for DisplayItem precomputed column text."""
+
+    def test_display_columns_for_installed_item(self) -> None:
+        """Name/source, status and description columns are built at construction."""
+        item = DisplayItem(
+            name="Test\x1b[31m Item",
+            item_type="skill",
+            description="A test item",
+            source_name="test-source",
+            platforms=["claude", "vscode"],
+            installed_platforms=["claude", "vscode"],
+            raw_data=None,
+            relative_path="skills/test-item/SKILL.md",
+        )
+        assert item.display_name_source == "Test Item \u2022 test-source"
+        assert item.display_status == "[claude, vscode]"
+        assert item.display_description == "[skills/test-item] A test item"
+
+    def test_display_columns_defaults(self) -> None:
+        """Missing description and top-level path produce no prefix."""
+        item = DisplayItem(
+            name="Item",
+            item_type="agent",
+            description="",
+            source_name="src",
+            platforms=["claude"],
+            installed_platforms=[],
+            raw_data=None,
+            relative_path="item.md",
+        )
+        assert item.display_status == ""
+        assert item.display_description == "No description"
+
+    def test_display_description_truncated(self) -> None:
+        """Prefixed descriptions are truncated to the column width."""
+        item = DisplayItem(
+            name="Item",
+            item_type="skill",
+            description="x" * 55,
+            source_name="src",
+            platforms=["claude"],
+            installed_platforms=[],
+            raw_data=None,
+            relative_path="skills/item/SKILL.md",
+        )
+        assert len(item.display_description) == DisplayItem.MAX_DESCRIPTION_LENGTH
+        assert item.display_description.endswith("...")
+
+
 class TestDisplaySource:
     """Tests for DisplaySource dataclass."""
 
@@ -388,7 +448,7 @@ class TestLocationSelectionScreen:
 
             screen = app.screen
             assert isinstance(screen, LocationSelectionScreen)
-            options = screen._location_options
+            options = screen._option_widgets
             assert len(options) == 2
 
             first_option = options[0]
@@ -412,7 +472,7 @@ class TestLocationSelectionScreen:
 
             screen = app.screen
             assert isinstance(screen, LocationSelectionScreen)
-            options = screen._location_options
+            options = screen._option_widgets
 
             assert options[0].selected is True
             assert options[1].selected is False
@@ -627,6 +687,7 @@ class TestAddSourceScreen:
             assert isinstance(app.screen, AddSourceScreen)
             assert app.dismissed is False
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_shorthand_expands_to_github_url(self) -> None:
         """Test owner/repo shorthand expands to GitHub URL."""
@@ -651,6 +712,7 @@ class TestAddSourceScreen:
             assert app.dismissed is True
             assert app.result == "https://github.com/rjmurillo/skills"
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_https_url_passes_through(self) -> None:
         """Test HTTPS URL passes through unchanged."""
@@ -674,6 +736,7 @@ class TestAddSourceScreen:
             assert app.dismissed is True
             assert app.result == url
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_ssh_url_passes_through(self) -> None:
         """Test SSH URL passes through unchanged."""
@@ -697,6 +760,7 @@ class TestAddSourceScreen:
             assert app.dismissed is True
             assert app.result == url
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
     async def test_invalid_url_shows_error(self) -> None:
         """Test invalid URL format shows error and does not dismiss."""
@@ -874,27 +938,123 @@ class TestSourceListView:
             assert app.source_list.refresh_count == 2
 
     @pytest.mark.asyncio
-    async def test_row_ids_unique_across_refreshes(self) -> None:
-        """Test row IDs are unique even when refreshed with same data.
+    async def test_refresh_reuses_row_for_same_source(self) -> None:
+        """Refreshing with the same source reuses its row instead of remounting.
 
-        This tests the fix for DuplicateIds crash on uninstall.
+        Reusing the row also avoids the DuplicateIds crash on uninstall that
+        remounting with a stale ID used to cause.
         """
         app = _SourceListTestApp()
-        async with app.run_test():
+        async with app.run_test() as pilot:
             source = _make_test_display_source("ComposioHQ/awesome-codex-skills")
 
-            # First set
             app.source_list.set_sources([source])
-            first_row_id = app.source_list._rows[0].id
+            await pilot.pause()
+            first_row = app.source_list._rows[0]
 
             # Second set (simulating refresh after uninstall)
             app.source_list.set_sources([source])
-            second_row_id = app.source_list._rows[0].id
+            await pilot.pause()
+
+            assert app.source_list._rows[0] is first_row
+            assert "1--0--" in first_row.id  # counter 1, index 0
+            assert len(app.source_list.query(SourceRow)) == 1
+
+    @pytest.mark.asyncio
+    async def test_set_sources_diffs_rows_by_name(self) -> None:
+        """Rows are updated in place, removed, or mounted in source order."""
+        app = _SourceListTestApp()
+        async with app.run_test() as pilot:
+            first = _make_test_display_source("first")
+            second = _make_test_display_source("second")
+            app.source_list.set_sources([first, second])
+            await pilot.pause()
+            second_row = app.source_list._rows[1]
+
+            updated = DisplaySource(
+                name="second",
+                display_name="Test Source",
+                url="https://github.com/test/source",
+                available_count=5,
+                installed_count=2,
+                last_sync="Never",
+                raw_data=None,
+            )
+            added = _make_test_display_source("added")
+            app.source_list.set_sources([added, updated])
+            await pilot.pause()
+
+            rows = list(app.source_list.query(SourceRow))
+            assert [row.source.name for row in rows] == ["added", "second"]
+            assert rows[1] is second_row
+            assert rows[0].id.startswith("test-sources--2--0--")
+            stats = second_row.query_one(".source-stats", Static)
+            assert "2 installed" in str(stats.render())
+            assert rows[0].selected is True
+            assert second_row.selected is False
+
+    @pytest.mark.asyncio
+    async def test_set_sources_resets_selection_from_nonzero(self) -> None:
+        """Only the first row stays highlighted when rows shift under the cursor."""
+        app = _SourceListTestApp()
+        async with app.run_test() as pilot:
+            names = ["a", "b", "c"]
+            app.source_list.set_sources([_make_test_display_source(n) for n in names])
+            await pilot.pause()
+            app.source_list.selected_index = 2
+
+            app.source_list.set_sources([_make_test_display_source(n) for n in ["z", *names]])
+            await pilot.pause()
+            rows = list(app.source_list.query(SourceRow))
+            assert [row.selected for row in rows] == [True, False, False, False]
+
+            app.source_list.selected_index = 2
+            app.source_list.set_sources([_make_test_display_source(n) for n in ["b", "c"]])
+            await pilot.pause()
+            rows = list(app.source_list.query(SourceRow))
+            assert [row.selected for row in rows] == [True, False]
+            assert app.source_list.selected_index == 0
+
+    @pytest.mark.asyncio
+    async def test_set_sources_without_kept_rows_uses_bulk_path(self) -> None:
+        """Initial population and full replacement mount and remove in bulk."""
+        app = _SourceListTestApp()
+        async with app.run_test() as pilot:
+            source_list = app.source_list
+            with (
+                patch.object(source_list, "mount", wraps=source_list.mount) as mount,
+                patch.object(source_list, "mount_all", wraps=source_list.mount_all) as mount_all,
+                patch.object(
+                    source_list, "remove_children", wraps=source_list.remove_children
+                ) as remove_children,
+            ):
+                source_list.set_sources([_make_test_display_source(n) for n in ["a", "b"]])
+                await pilot.pause()
+                source_list.set_sources([_make_test_display_source(n) for n in ["c", "d"]])
+                await pilot.pause()
+
+            assert mount_all.call_count == 2
+            assert remove_children.call_count == 2
+            # mount_all forwards every row in one mount call; no per-row mounts
+            assert [len(call.args) for call in mount.call_args_list] == [2, 2]
+            rows = list(source_list.query(SourceRow))
+            assert [row.source.name for row in rows] == ["c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_set_sources_reorder_rebuilds(self) -> None:
+        """A reordered source list is rebuilt in the new order."""
+        app = _SourceListTestApp()
+        async with app.run_test() as pilot:
+            first = _make_test_display_source("first")
+            second = _make_test_display_source("second")
+            app.source_list.set_sources([first, second])
+            await pilot.pause()
 
-            # IDs should be different due to update counter
-            assert first_row_id != second_row_id
-            assert "1--0--" in first_row_id  # counter 1, index 0
-            assert "2--0--" in second_row_id  # counter 2, index 0
+            app.source_list.set_sources([second, first])
+            await pilot.pause()
+
+            rows = list(app.source_list.query(SourceRow))
+            assert [row.source.name for row in rows] == ["second", "first"]
 
     @pytest.mark.asyncio
     async def test_make_row_id_includes_refresh_count(self) -> None:
@@ -1171,6 +1331,36 @@ class TestDataManager:
         # Should not raise
         manager.update_stale_sources()
 
+    def test_update_stale_sources_records_only_successes(self) -> None:
+        """Test failed fetches are skipped while the other sources still sync."""
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+
+        from skill_installer.gitops import GitOpsError
+        from skill_installer.tui.data_manager import DataManager
+
+        sources = [
+            SimpleNamespace(name=name, url=f"https://example.com/{name}.git")
+            for name in ("first", "broken", "last")
+        ]
+        mock_registry = MagicMock()
+        mock_registry.get_stale_auto_update_sources.return_value = sources
+        mock_gitops = MagicMock()
+
+        def clone_or_fetch(url: str, name: str) -> Path:
+            if name == "broken":
+                raise GitOpsError("network down")
+            return Path("/cache") / name
+
+        mock_gitops.clone_or_fetch.side_effect = clone_or_fetch
+
+        manager = DataManager(registry_manager=mock_registry, gitops=mock_gitops)
+        manager.update_stale_sources()
+
+        assert mock_gitops.clone_or_fetch.call_count == 3
+        synced = [c.args[0] for c in mock_registry.update_source_sync_time.call_args_list]
+        assert synced == ["first", "last"]
+
     def test_load_all_data_no_registry(self) -> None:
         """Test load_all_data returns empty with status message when no registry."""
         from skill_installer.tui.data_manager import DataManager
@@ -1469,10 +1659,14 @@ class _ItemListTestApp(App):
         from skill_installer.tui.widgets.item_list import ItemListView
 
         self.item_list = ItemListView(id="test-items")
+        self.selected_items: list[DisplayItem] = []
 
     def compose(self) -> ComposeResult:
         yield self.item_list
 
+    def on_item_data_table_item_selected(self, event: ItemDataTable.ItemSelected) -> None:
+        self.selected_items.append(event.item)
+
 
 class TestItemListView:
     """Tests for ItemListView (ItemDataTable) widget."""
@@ -1638,6 +1832,153 @@ class TestItemDataTable:
             app.item_list.action_toggle()
             assert len(app.item_list.get_checked_items()) == 0
 
+    @pytest.mark.asyncio
+    async def test_set_items_renders_checked_indicator(self) -> None:
+        """Checked rows keep their indicator when items are replaced."""
+        app = _ItemListTestApp()
+        async with app.run_test():
+            item = _make_test_display_item()
+            app.item_list.set_items([item])
+            app.item_list.action_toggle()
+
+            app.item_list.set_items([item])
+
+            assert app.item_list.get_checked_items() == [item]
+            checked = app.item_list._indicators["checked"]
+            assert app.item_list.get_cell_at(Coordinate(0, 0)) == checked
+
+    @pytest.mark.asyncio
+    async def test_enter_posts_selected_item_by_row_key(self) -> None:
+        """Enter resolves the selected row to its item via the row key."""
+        app = _ItemListTestApp()
+        async with app.run_test() as pilot:
+            first = _make_test_display_item()
+            second = _make_test_display_item(name="Item 2")
+            app.item_list.set_items([first, second])
+            app.item_list.focus()
+            app.item_list.action_cursor_down()
+
+            await pilot.press("enter")
+            await pilot.pause()
+
+            assert app.selected_items == [second]
+
+    @pytest.mark.asyncio
+    async def test_get_checked_items_in_display_order(self) -> None:
+        """Checked items are returned in display order."""
+        app = _ItemListTestApp()
+        async with app.run_test():
+            items = [_make_test_display_item(name=f"Item {i}") for i in range(3)]
+            app.item_list.set_items(items)
+            app.item_list.action_cursor_down()
+            app.item_list.action_cursor_down()
+            app.item_list.action_toggle()
+            app.item_list.action_cursor_up()
+            app.item_list.action_cursor_up()
+            app.item_list.action_toggle()
+
+            assert app.item_list.get_checked_items() == [items[0], items[2]]
+
+    @pytest.mark.asyncio
+    async def test_set_items_debounced_applies_latest(self) -> None:
+        """Rapid debounced updates coalesce into the most recent list."""
+        app = _ItemListTestApp()
+        async with app.run_test() as pilot:
+            first = [_make_test_display_item(name="First")]
+            latest = [_make_test_display_item(name="Latest")]
+            app.item_list.set_items_debounced(first)
+            app.item_list.set_items_debounced(latest)
+            assert app.item_list.items == []
+
+            await pilot.pause(app.item_list.DEBOUNCE_SECONDS * 3)
+
+            assert app.item_list.items == latest
+
+    @pytest.mark.asyncio
+    async def test_set_items_cancels_pending_debounce(self) -> None:
+        """An immediate set_items wins over a pending debounced update."""
+        app = _ItemListTestApp()
+        async with app.run_test() as pilot:
+            stale = [_make_test_display_item(name="Stale")]
+            current = [_make_test_display_item(name="Current")]
+            app.item_list.set_items_debounced(stale)
+            app.item_list.set_items(current)
+
+            await pilot.pause(app.item_list.DEBOUNCE_SECONDS * 3)
+
+            assert app.item_list.items == current
+
+    @pytest.mark.asyncio
+    async def test_set_items_narrowing_removes_rows_in_place(self) -> None:
+        """Narrowing to a subset removes rows without a rebuild."""
+        app = _ItemListTestApp()
+        async with app.run_test():
+            items = [_make_test_display_item(name=f"Item {i}") for i in range(4)]
+            table = app.item_list
+            table.set_items(items)
+
+            with patch.object(table, "clear", wraps=table.clear) as mock_clear:
+                table.set_items([items[0], items[2], items[3]])
+                table.set_items([items[0], items[2], items[3], items[1]])
+
+            mock_clear.assert_not_called()
+            keys = [row.key.value for row in table.ordered_rows]
+            assert keys == [items[i].unique_id for i in (0, 2, 3, 1)]
+            assert table.cursor_row == 0
+
+    @pytest.mark.asyncio
+    async def test_set_items_reorder_rebuilds(self) -> None:
+        """Reordered or replaced items fall back to a full rebuild."""
+        app = _ItemListTestApp()
+        async with app.run_test():
+            items = [_make_test_display_item(name=f"Item {i}") for i in range(3)]
+            table = app.item_list
+            table.set_items(items)
+
+            with patch.object(table, "clear", wraps=table.clear) as mock_clear:
+                table.set_items(list(reversed(items)))
+
+            mock_clear.assert_called_once()
+            keys = [row.key.value for row in table.ordered_rows]
+            assert keys == [item.unique_id for item in reversed(items)]
+
+    @pytest.mark.asyncio
+    async def test_checked_state_survives_filtering_out(self) -> None:
+        """A checked item hidden by a filter is still checked when shown again."""
+        app = _ItemListTestApp()
+        async with app.run_test():
+            items = [_make_test_display_item(name=f"Item {i}") for i in range(2)]
+            table = app.item_list
+            table.set_items(items)
+            table.action_toggle()
+
+            table.set_items([items[1]])
+            assert table.get_checked_items() == []
+
+            table.set_items(items)
+            assert table.get_checked_items() == [items[0]]
+
+    @pytest.mark.asyncio
+    async def test_clear_checked_resets_indicators(self) -> None:
+        """clear_checked restores the unchecked/installed indicator."""
+        app = _ItemListTestApp()
+        async with app.run_test():
+            items = [
+                _make_test_display_item(name="Plain"),
+                _make_test_display_item(name="Installed", installed_platforms=["claude"]),
+            ]
+            table = app.item_list
+            table.set_items(items)
+            table.action_toggle()
+            table.action_cursor_down()
+            table.action_toggle()
+
+            table.clear_checked()
+
+            assert table.get_checked_items() == []
+            assert table.get_cell_at(Coordinate(0, 0)) == table._indicators["unchecked"]
+            assert table.get_cell_at(Coordinate(1, 0)) == table._indicators["installed"]
+
     @pytest.mark.asyncio
     async def test_toggle_ignored_during_filtering(self) -> None:
         """Toggle is ignored when _is_filtering flag is set (race protection)."""
@@ -2005,6 +2346,26 @@ class TestScrollIndicatorDetails:
             indicator.update_position(3, 4, 10)
             # Should show both "more above" and "more below"
 
+    @pytest.mark.asyncio
+    async def test_update_skipped_when_state_unchanged(self) -> None:
+        """Moving without crossing a boundary does not re-render the text."""
+        app = _ScrollIndicatorTestApp()
+        async with app.run_test():
+            from skill_installer.tui.widgets.scroll_indicator import ScrollIndicator
+
+            indicator = app.query_one("#test-indicator", ScrollIndicator)
+
+            with patch.object(indicator, "update") as mock_update:
+                indicator.update_position(0, 10, 10)
+                indicator.update_position(1, 4, 10)
+                indicator.update_position(2, 4, 10)
+                indicator.update_position(6, 4, 10)
+
+            assert [c.args[0] for c in mock_update.call_args_list] == [
+                "\u2191 more above | \u2193 more below",
+                "\u2191 more above",
+            ]
+
 
 # ============================================================================
 # More DataManager Tests
@@ -3104,3 +3465,22 @@ class TestUpdateItemOperation:
         assert any("Network error" in msg for msg, sev in notifications if sev == "error")
         # Should not call installer if fetch failed
         mock_installer.install_item.assert_not_called()
+
+
+class TestTuiPackageExports:
+    """Tests for the lazily loaded tui package exports."""
+
+    def test_lazy_export_resolves(self) -> None:
+        """Textual-backed names resolve to their defining module's objects."""
+        import skill_installer.tui as tui_package
+        from skill_installer.tui.app import SkillInstallerApp as AppClass
+
+        assert tui_package.SkillInstallerApp is AppClass
+        assert "SkillInstallerApp" in dir(tui_package)
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Unknown names raise AttributeError like a normal module."""
+        import skill_installer.tui as tui_package
+
+        with pytest.raises(AttributeError):
+            tui_package.NotAnExport  # noqa: B018
@@ -1,6 +1,11 @@
 """Tests for the validation module."""
 
-from skill_installer.validation import FrontmatterResult, parse_frontmatter
+from skill_installer.validation import (
+    FrontmatterResult,
+    _load_yaml_block,
+    parse_frontmatter,
+    parse_frontmatter_fields,
+)
 
 
 class TestFrontmatterResult:
@@ -11,7 +16,7 @@ class TestFrontmatterResult:
         result = FrontmatterResult(data="name: test")
         assert result.success is True
         assert result.data == "name: test"
-        assert result.errors == []
+        assert result.errors == ()
 
     def test_failure_when_errors_present(self) -> None:
         """Result is failure when errors list has items."""
@@ -20,11 +25,15 @@ class TestFrontmatterResult:
         assert result.data == ""
         assert result.errors == ["missing frontmatter"]
 
+    def test_empty_errors_shared(self) -> None:
+        """Successful results share one empty errors tuple."""
+        assert FrontmatterResult().errors is FrontmatterResult(data="x").errors
+
     def test_default_values(self) -> None:
         """Default values are empty string and empty list."""
         result = FrontmatterResult()
         assert result.data == ""
-        assert result.errors == []
+        assert result.errors == ()
         assert result.success is True
 
 
@@ -38,7 +47,7 @@ class TestParseFrontmatter:
         assert result.success is True
         assert "name: test" in result.data
         assert "description: A test" in result.data
-        assert result.errors == []
+        assert result.errors == ()
 
     def test_missing_opening_delimiter(self) -> None:
         """Returns error when content does not start with ---."""
@@ -97,3 +106,53 @@ Body content here"""
         assert result.success is True
         assert "name: complex-agent" in result.data
         assert "tools:" in result.data
+
+    def test_bytes_frontmatter(self) -> None:
+        """Parses UTF-8 bytes and returns the frontmatter as str."""
+        content = "---\nname: café\n---\nBody ☃".encode()
+        result = parse_frontmatter(content)
+        assert result.success is True
+        assert result.data == "name: café"
+
+    def test_bytes_missing_closing_delimiter(self) -> None:
+        """Reports the same errors for bytes as for str."""
+        assert parse_frontmatter(b"---\nname: test").errors == [
+            "Invalid frontmatter: missing closing ---"
+        ]
+        assert parse_frontmatter(b"name: test").errors == ["Content must have YAML frontmatter"]
+
+
+class TestParseFrontmatterFields:
+    """Tests for parse_frontmatter_fields function."""
+
+    def test_loads_yaml_fields(self) -> None:
+        """Returns the frontmatter loaded as a dict."""
+        content = "---\nname: test\ntools:\n  - read\n  - edit\n---\nBody"
+        assert parse_frontmatter_fields(content) == {"name": "test", "tools": ["read", "edit"]}
+
+    def test_missing_frontmatter(self) -> None:
+        """Returns an empty dict when there is no frontmatter."""
+        assert parse_frontmatter_fields("# Just a body") == {}
+
+    def test_invalid_yaml(self) -> None:
+        """Returns an empty dict when the YAML is invalid."""
+        assert parse_frontmatter_fields("---\nname: [unclosed\n---\nBody") == {}
+
+    def test_empty_frontmatter(self) -> None:
+        """Returns an empty dict for an empty frontmatter block."""
+        assert parse_frontmatter_fields("---\n---\nBody") == {}
+
+    def test_non_mapping_frontmatter(self) -> None:
+        """Returns an empty dict when the YAML is not a mapping."""
+        assert parse_frontmatter_fields("---\n- read\n- edit\n---\nBody") == {}
+
+    def test_repeated_block_is_cached(self) -> None:
+        """Repeated blocks reuse the parse but return independent dicts."""
+        content = "---\nname: cached-block-test\ntools:\n  - Read\n---\nBody"
+        first = parse_frontmatter_fields(content)
+        hits = _load_yaml_block.cache_info().hits
+        first["plugin"] = "mutated"
+        first["tools"].append("Write")
+        second = parse_frontmatter_fields(content.replace("Body", "Other body"))
+        assert _load_yaml_block.cache_info().hits == hits + 1
+        assert second == {"name": "cached-block-test", "tools": ["Read"]}